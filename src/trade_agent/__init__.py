@@ -1,8 +1,49 @@
-from .brokers.paper import PaperBroker
-from .engine.backtest import BacktestEngine, BacktestResult
-from .loaders.parquet import load_candles_from_store
-from .risks.fixed_fraction import FixedFractionRisk
-from .types import BrokerLike, Candle, OrderSide, RiskLike, Signal, StrategyLike, Trade
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .types import (
+    BatchStrategyLike,
+    BrokerLike,
+    Candle,
+    OrderSide,
+    RiskLike,
+    Signal,
+    StrategyLike,
+    Trade,
+)
+
+if TYPE_CHECKING:
+    from .brokers.paper import PaperBroker
+    from .engine.backtest import BacktestEngine, BacktestResult
+    from .loaders.parquet import load_candles_from_store
+    from .risks.fixed_fraction import FixedFractionRisk
+
+# Heavier submodules (pandas/pyarrow-backed) load on first attribute access,
+# so `import trade_agent.analysis...` from a CLI doesn't pull the engine in.
+_LAZY: dict[str, tuple[str, str]] = {
+    "BacktestEngine": (".engine.backtest", "BacktestEngine"),
+    "BacktestResult": (".engine.backtest", "BacktestResult"),
+    "PaperBroker": (".brokers.paper", "PaperBroker"),
+    "load_candles_from_store": (".loaders.parquet", "load_candles_from_store"),
+    "FixedFractionRisk": (".risks.fixed_fraction", "FixedFractionRisk"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), attr)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Engine
@@ -22,5 +63,6 @@ __all__ = [
     # Protocols
     "BrokerLike",
     "StrategyLike",
+    "BatchStrategyLike",
     "RiskLike",
 ]
@@ -0,0 +1,75 @@
+"""Optional Numba JIT and Bottleneck moving windows for hot numeric kernels.
+
+Install the ``fast`` extra (``pip install -e ".[fast]"``) to compile kernels
+with Numba. Without it, ``njit`` is a no-op decorator and callers should use
+their pandas/NumPy path instead (check ``HAS_NUMBA``). Likewise
+``move_max``/``move_min`` are Bottleneck's C kernels when installed and
+``None`` otherwise (check ``HAS_BOTTLENECK``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+try:
+    from numba import njit as _numba_njit
+    from numba import prange
+except ImportError:  # pragma: no cover - depends on environment
+    _numba_njit = None
+    prange = range  # serial loop; kernels stay plain Python
+
+try:
+    from bottleneck import move_max, move_min
+except ImportError:  # pragma: no cover - depends on environment
+    move_max = move_min = None
+
+HAS_NUMBA: bool = _numba_njit is not None
+HAS_BOTTLENECK: bool = move_max is not None
+
+
+def njit(*args, **kwargs) -> Callable:
+    """``numba.njit`` when Numba is installed, identity decorator otherwise.
+
+    Supports both ``@njit`` and ``@njit(cache=True, ...)`` forms.
+    """
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda fn: fn
+
+
+def warm() -> None:
+    """Compile every ``cache=True`` kernel once so later runs load it from disk.
+
+    Drives the public entry points on synthetic bars, so each kernel is built
+    for the exact argument types real calls use. A no-op without Numba.
+    """
+    if not HAS_NUMBA:
+        return
+    import numpy as np
+    import pandas as pd
+
+    from .analysis.indicators import rsi
+    from .analysis.sr import compute_sr
+    from .analysis.trend import compute_trend
+    from .backtest.facts_strategy import (
+        generate_signals,
+        generate_signals_grid,
+        run_vectorized_backtest,
+    )
+
+    close = 100.0 + np.cumsum(np.sin(np.arange(300) / 7.0))
+    df = pd.DataFrame(
+        {"open": close, "high": close + 1.0, "low": close - 1.0, "close": close, "volume": 1.0},
+        index=pd.date_range("2024-01-01", periods=close.size, freq="h", tz="UTC", name="open_time"),
+    )
+    compute_trend(df)
+    compute_sr(df)
+    rsi(df["close"])
+    run_vectorized_backtest(df, generate_signals(df))
+    generate_signals_grid(df, [{}])
+
+
+if __name__ == "__main__":
+    warm()
@@ -0,0 +1,56 @@
+"""Content-keyed memo for indicator passes reused within one process.
+
+Entries are keyed on a digest of the input index and columns, so an in-place
+edit anywhere in a frame misses instead of serving a stale result, and an
+equal copy of a frame hits. Cached values are shared: treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+import numpy as np
+import pandas as pd
+
+T = TypeVar("T")
+
+
+def fingerprint(index: pd.Index, *columns: pd.Series) -> bytes:
+    """128-bit digest of an index plus equal-length float columns."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{index.dtype}:{len(index)}".encode())
+    if isinstance(index, pd.RangeIndex):
+        h.update(repr((index.start, index.step)).encode())
+    elif isinstance(index, pd.DatetimeIndex):
+        h.update(index.asi8)
+    else:
+        h.update(pd.util.hash_pandas_object(index, index=False).to_numpy())
+    for col in columns:
+        h.update(np.ascontiguousarray(col.to_numpy(dtype=np.float64)))
+    return h.digest()
+
+
+class ContentMemo:
+    """Bounded LRU of ``key -> value``; keys should embed a ``fingerprint``."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the cached value for ``key``, computing and storing it on a miss."""
+        try:
+            self._data.move_to_end(key)
+            return self._data[key]
+        except KeyError:
+            pass
+        value = self._data[key] = compute()
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -13,6 +13,9 @@ Usage:
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+from .trend import TrendFacts, trend_table
 
 # Entry TF → which TF provides directional bias
 BIAS_MAP: dict[str, str] = {
@@ -24,64 +27,76 @@ BIAS_MAP: dict[str, str] = {
 # Timeframes that provide macro context (override if strong)
 MACRO_TFS: list[str] = ["1w", "1M"]
 
+_BIAS_STEPS: tuple[tuple[str, str], ...] = tuple(BIAS_MAP.items())
+
 
-def _trend_to_bias(trend_facts: dict) -> str:
+def _trend_to_bias(trend_dir: str | None) -> str:
     """Convert trend_dir → bias string: 'long', 'short', or 'neutral'."""
-    d = trend_facts.get("trend_dir", "sideway")
-    if d == "up":
+    if trend_dir == "up":
         return "long"
-    if d == "down":
+    if trend_dir == "down":
         return "short"
     return "neutral"
 
 
-def _macro_bias(per_tf_facts: dict) -> str:
+def _macro_bias(trends: dict[str, TrendFacts]) -> str:
     """Derive macro context from 1w/1M: 'long', 'short', or 'neutral'."""
-    for tf in MACRO_TFS:
-        tf_data = per_tf_facts.get(tf, {})
-        trend = tf_data.get("trend", {})
-        if not trend:
+    return _macro_bias_cached(tuple(trends.get(tf) for tf in MACRO_TFS))
+
+
+@lru_cache(maxsize=128)
+def _macro_bias_cached(macro_trends: tuple[TrendFacts | None, ...]) -> str:
+    """Memoized body of _macro_bias, keyed on the (hashable) macro TF facts."""
+    for trend in macro_trends:
+        if trend is None:
             continue
         # Only override if not sideway AND strength > 0.2
-        if not trend.get("is_sideway", True) and trend.get("trend_strength", 0) > 0.2:
-            return _trend_to_bias(trend)
+        sideway = True if trend.is_sideway is None else trend.is_sideway
+        if not sideway and (trend.trend_strength or 0) > 0.2:
+            return _trend_to_bias(trend.trend_dir)
     return "neutral"
 
 
-def compute_bias_chain(per_tf_facts: dict) -> dict:
+@lru_cache(maxsize=16)
+def _resolve_bias(bias: str, macro: str) -> tuple[str, str]:
+    """(effective_bias, confidence) for a TF bias under the macro context."""
+    # Macro override: if bias is neutral but macro is strong, adopt macro
+    effective_bias = bias
+    if bias == "neutral" and macro != "neutral":
+        effective_bias = macro
+
+    # Confidence: aligned = high, conflicting = low
+    if bias == macro or macro == "neutral":
+        confidence = "high"
+    elif bias == "neutral":
+        confidence = "medium"
+    else:
+        confidence = "low"  # bias and macro conflict
+    return effective_bias, confidence
+
+
+def compute_bias_chain(
+    per_tf_facts: dict,
+    trends: dict[str, TrendFacts] | None = None,
+) -> dict:
     """Compute bias chain for each entry timeframe.
 
     Args:
         per_tf_facts: {interval: {"trend": {...}, "sr": {...}}}
+        trends:       optional precomputed ``trend_table(per_tf_facts)``
 
     Returns:
         {entry_tf: {"bias": str, "from_tf": str, "macro": str, "confidence": str}}
     """
-    macro = _macro_bias(per_tf_facts)
+    if trends is None:
+        trends = trend_table(per_tf_facts)
+    macro = _macro_bias(trends)
     chain: dict[str, dict] = {}
 
-    for entry_tf, bias_tf in BIAS_MAP.items():
-        bias_data = per_tf_facts.get(bias_tf, {})
-        bias_trend = bias_data.get("trend", {})
-
-        if not bias_trend:
-            bias = "neutral"
-        else:
-            bias = _trend_to_bias(bias_trend)
-
-        # Macro override: if bias is neutral but macro is strong, adopt macro
-        effective_bias = bias
-        if bias == "neutral" and macro != "neutral":
-            effective_bias = macro
-
-        # Confidence: aligned = high, conflicting = low
-        if bias == macro or macro == "neutral":
-            confidence = "high"
-        elif bias == "neutral":
-            confidence = "medium"
-        else:
-            confidence = "low"  # bias and macro conflict
-
+    for entry_tf, bias_tf in _BIAS_STEPS:
+        bias_trend = trends.get(bias_tf)
+        bias = _trend_to_bias(bias_trend.trend_dir if bias_trend is not None else None)
+        effective_bias, confidence = _resolve_bias(bias, macro)
         chain[entry_tf] = {
             "bias": effective_bias,
             "from_tf": bias_tf,
@@ -6,6 +6,25 @@ LLM uses this to avoid hallucinating: every recommendation has evidence.
 
 from __future__ import annotations
 
+from itertools import islice
+
+# Timeframes reported in the evidence lines
+_TREND_TFS = ("1w", "1d", "4h", "1h")
+_BIAS_TFS = ("15m", "1h", "4h")
+
+# Line templates, bound once instead of re-parsing f-string specs per line
+_TREND_FMT = "  {}: {} (strength={:.2f}, ATR%={:.1f}%)".format
+_LEVEL_FMT = "{:,.0f} (score={:.1f}, src={})".format
+_TARGET_FMT = "TARGET TP{}: {:,.0f} (R:R={:.1f}, from {})".format
+
+
+def _level_str(levels: list[dict], kind: str, limit: int = 2) -> str:
+    """Join the first ``limit`` levels of ``kind`` into one evidence string."""
+    picked = islice((lv for lv in levels if lv["kind"] == kind), limit)
+    return ", ".join(
+        _LEVEL_FMT(lv["price"], lv.get("score", 0), lv.get("source_tf", "?")) for lv in picked
+    )
+
 
 def explain_plan(facts: dict, plan: dict) -> list[str]:
     """Generate evidence lines explaining the trade plan.
@@ -25,19 +44,18 @@ def explain_plan(facts: dict, plan: dict) -> list[str]:
 
     # 2. Trend per TF
     trends = facts.get("trends", {})
-    for tf in ("1w", "1d", "4h", "1h"):
+    for tf in _TREND_TFS:
         t = trends.get(tf, {})
         if t:
-            d = t.get("dir", "?")
-            s = t.get("strength", 0)
-            atr = t.get("atr_pct", 0)
-            lines.append(f"  {tf}: {d} (strength={s:.2f}, ATR%={atr:.1f}%)")
+            lines.append(
+                _TREND_FMT(tf, t.get("dir", "?"), t.get("strength", 0), t.get("atr_pct", 0))
+            )
 
     # 3. Bias chain
     chain = plan.get("bias_chain", {})
     if chain:
         parts = []
-        for tf in ("15m", "1h", "4h"):
+        for tf in _BIAS_TFS:
             b = chain.get(tf, {})
             if b:
                 parts.append(f"{tf}→{b.get('bias', '?')}({b.get('from_tf', '?')})")
@@ -59,25 +77,16 @@ def explain_plan(facts: dict, plan: dict) -> list[str]:
 
     # 5. Top S/R levels
     levels = facts.get("key_levels", [])
-    sup = [lv for lv in levels if lv["kind"] == "support"][:2]
-    res = [lv for lv in levels if lv["kind"] == "resistance"][:2]
-    if sup:
-        sup_str = ", ".join(
-            f"{lv['price']:,.0f} (score={lv.get('score', 0):.1f}, src={lv.get('source_tf', '?')})"
-            for lv in sup
-        )
+    sup_str = _level_str(levels, "support")
+    res_str = _level_str(levels, "resistance")
+    if sup_str:
         lines.append(f"SUPPORT: {sup_str}")
-    if res:
-        res_str = ", ".join(
-            f"{lv['price']:,.0f} (score={lv.get('score', 0):.1f}, src={lv.get('source_tf', '?')})"
-            for lv in res
-        )
+    if res_str:
         lines.append(f"RESISTANCE: {res_str}")
 
     # 6. Entry reasoning
     entries = plan.get("entry_rules", [])
-    for e in entries:
-        lines.append(f"ENTRY: {e.get('trigger', '?')} — {e.get('condition', '')}")
+    lines.extend(f"ENTRY: {e.get('trigger', '?')} — {e.get('condition', '')}" for e in entries)
 
     # 7. Stop reasoning
     stop = plan.get("stop", {})
@@ -88,15 +97,12 @@ def explain_plan(facts: dict, plan: dict) -> list[str]:
 
     # 8. Target reasoning
     targets = plan.get("targets", [])
-    for t in targets:
-        lines.append(
-            f"TARGET TP{t['tp']}: {t['price']:,.0f} "
-            f"(R:R={t.get('rr', '?'):.1f}, from {t.get('source', '?')})"
-        )
+    lines.extend(
+        _TARGET_FMT(t["tp"], t["price"], t.get("rr", "?"), t.get("source", "?")) for t in targets
+    )
 
     # 9. No-trade conditions
     no_trade = plan.get("no_trade", [])
-    for nt in no_trade:
-        lines.append(f"⚠️ {nt}")
+    lines.extend(f"⚠️ {nt}" for nt in no_trade)
 
     return lines
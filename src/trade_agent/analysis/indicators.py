@@ -1,12 +1,96 @@
-"""Vectorized technical indicators — pure pandas, no external TA library needed."""
+"""Vectorized technical indicators — pure pandas, no external TA library needed.
+
+ema/atr/rsi switch to Numba-compiled recurrences when the ``fast`` extra is
+installed; the kernels reproduce pandas' ``ewm(adjust=False).mean()`` exactly.
+"""
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+from .._jit import HAS_NUMBA, njit
+from .._memo import ContentMemo, fingerprint
+
+# ── Numba kernels ─────────────────────────────────────────────────────────────
+
+
+@njit(cache=True)
+def _ewm_nb(x: np.ndarray, alpha: float, min_periods: int) -> np.ndarray:
+    """Port of pandas' ``ewm(alpha=alpha, adjust=False).mean()`` (NaN-aware)."""
+    n = x.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    minp = max(min_periods, 1)
+    old_wt_factor = 1.0 - alpha
+    weighted = x[0]
+    nobs = 0 if np.isnan(weighted) else 1
+    out[0] = weighted if nobs >= minp else np.nan
+    old_wt = 1.0
+    for i in range(1, n):
+        cur = x[i]
+        is_obs = not np.isnan(cur)
+        if is_obs:
+            nobs += 1
+        if not np.isnan(weighted):
+            old_wt *= old_wt_factor
+            if is_obs:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_obs:
+            weighted = cur
+        out[i] = weighted if nobs >= minp else np.nan
+    return out
+
+
+@njit(cache=True)
+def _atr_nb(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """Wilder ATR: true range + RMA(alpha=1/period) in one pass."""
+    n = close.shape[0]
+    tr = np.empty(n)
+    for i in range(n):
+        tr[i] = high[i] - low[i]
+        if i > 0:
+            tr[i] = max(tr[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+    return _ewm_nb(tr, 1.0 / period, 0)
+
+
+@njit(cache=True)
+def _rsi_nb(x: np.ndarray, period: int) -> np.ndarray:
+    """RSI with RMA(alpha=1/period) smoothing, as 100 * gain / (gain + loss)."""
+    n = x.shape[0]
+    gain = np.empty(n)
+    loss = np.empty(n)
+    if n > 0:
+        gain[0] = np.nan
+        loss[0] = np.nan
+    for i in range(1, n):
+        d = x[i] - x[i - 1]
+        if np.isnan(d):
+            gain[i] = np.nan
+            loss[i] = np.nan
+        else:
+            gain[i] = max(d, 0.0)
+            loss[i] = max(-d, 0.0)
+    avg_g = _ewm_nb(gain, 1.0 / period, 0)
+    avg_l = _ewm_nb(loss, 1.0 / period, 0)
+    out = np.empty(n)
+    for i in range(n):
+        total = avg_g[i] + avg_l[i]
+        out[i] = np.nan if total == 0 else 100.0 * avg_g[i] / total
+    return out
+
+
+# ── Public API ────────────────────────────────────────────────────────────────
+
 
 def ema(series: pd.Series, period: int, adjust: bool = False) -> pd.Series:
     """Exponential Moving Average."""
+    if HAS_NUMBA and not adjust:
+        out = _ewm_nb(series.to_numpy(dtype=np.float64), 2.0 / (period + 1), 0)
+        return pd.Series(out, index=series.index, name=series.name)
     return series.ewm(span=period, adjust=adjust).mean()
 
 
@@ -16,28 +100,91 @@ def true_range(df: pd.DataFrame) -> pd.Series:
     Args:
         df: DataFrame with columns high, low, close.
     """
-    prev_close = df["close"].shift(1)
-    hl = df["high"] - df["low"]
-    hpc = (df["high"] - prev_close).abs()
-    lpc = (df["low"] - prev_close).abs()
-    return pd.concat([hl, hpc, lpc], axis=1).max(axis=1)
+    high = df["high"].to_numpy(dtype=np.float64)
+    low = df["low"].to_numpy(dtype=np.float64)
+    close = df["close"].to_numpy(dtype=np.float64)
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
+    # fmax ignores the NaN prev_close on the first bar, so TR[0] = H - L
+    tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+    return pd.Series(tr, index=df.index)
 
 
 def atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     """Average True Range (EMA-smoothed as Wilder's)."""
+    if HAS_NUMBA:
+        out = _atr_nb(
+            df["high"].to_numpy(dtype=np.float64),
+            df["low"].to_numpy(dtype=np.float64),
+            df["close"].to_numpy(dtype=np.float64),
+            period,
+        )
+        return pd.Series(out, index=df.index)
     tr = true_range(df)
     return tr.ewm(alpha=1 / period, adjust=False).mean()
 
 
+# ATR memo keyed on the frame's index + H/L/C content and the period
+_ATR_MEMO = ContentMemo(maxsize=16)
+
+
+def cached_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
+    """``atr(df, period)`` memoized on the frame's contents.
+
+    compute_trend and compute_sr run on the same frame per timeframe; this lets
+    them share one ATR pass. Any edit to the index or H/L/C forces a recompute.
+    Treat the returned Series as read-only.
+    """
+    key = (fingerprint(df.index, df["high"], df["low"], df["close"]), period)
+    return _ATR_MEMO.get_or_compute(key, lambda: atr(df, period))
+
+
 def sma(series: pd.Series, period: int) -> pd.Series:
-    """Simple Moving Average."""
-    return series.rolling(window=period, min_periods=period).mean()
+    """Simple Moving Average (prefix-sum, O(N) regardless of period).
+
+    Same semantics as ``rolling(period, min_periods=period).mean()``: the first
+    period-1 values and any window containing a NaN are NaN.
+    """
+    if period < 1:
+        raise ValueError("period must be >= 1")
+    a = series.to_numpy(dtype=np.float64)
+    out = np.full(a.size, np.nan)
+    if a.size >= period:
+        nan = np.isnan(a)
+        cs = np.zeros(a.size + 1)
+        np.cumsum(np.where(nan, 0.0, a), out=cs[1:])
+        cn = np.zeros(a.size + 1, dtype=np.int64)
+        np.cumsum(nan, out=cn[1:])
+        win = (cs[period:] - cs[:-period]) / period
+        win[(cn[period:] - cn[:-period]) > 0] = np.nan
+        out[period - 1 :] = win
+    return pd.Series(out, index=series.index)
+
+
+def sma_update(prev_mean: float, new_val: float, old_val: float, period: int) -> float:
+    """O(1) streaming SMA step: slide the window by one bar.
+
+    Args:
+        prev_mean: SMA of the previous window.
+        new_val:   value entering the window.
+        old_val:   value leaving the window.
+    """
+    return prev_mean + (new_val - old_val) / period
 
 
 def rsi(series: pd.Series, period: int = 14) -> pd.Series:
-    """Relative Strength Index (0-100)."""
+    """Relative Strength Index (0-100).
+
+    Uses the ``100 * gain / (gain + loss)`` form: no losses gives 100, and only
+    a flat line (no gains or losses) is undefined (NaN).
+    """
+    if HAS_NUMBA:
+        out = _rsi_nb(series.to_numpy(dtype=np.float64), period)
+        return pd.Series(out, index=series.index)
     delta = series.diff()
-    gain = delta.clip(lower=0).ewm(alpha=1 / period, adjust=False).mean()
-    loss = (-delta.clip(upper=0)).ewm(alpha=1 / period, adjust=False).mean()
-    rs = gain / loss.replace(0, float("nan"))
-    return 100 - (100 / (1 + rs))
+    gain = delta.clip(lower=0).ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+    loss = (-delta.clip(upper=0)).ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+    with np.errstate(invalid="ignore"):
+        out = 100.0 * gain / (gain + loss)
+    return pd.Series(out, index=series.index)
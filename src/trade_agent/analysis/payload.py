@@ -5,23 +5,36 @@ v2: macro/micro level merge, bias chain, regime classification.
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime
+from functools import lru_cache
 
 from .bias import compute_bias_chain
+from .trend import TrendFacts, trend_table
 
+# Timeframe orderings used across payload assembly
+_ALL_TFS = ("1w", "1M", "1d", "4h", "1h", "15m")  # macro → micro
+_PRICE_TFS = ("15m", "1h", "4h", "1d", "1w")  # micro → macro (freshest ema_fast first)
+_REGIME_TFS = ("1d", "4h")
 
-def _classify_regime(per_tf_facts: dict) -> str:
+# Macro TFs weigh more when merging S/R levels; everything else is 1.0
+_MACRO_WEIGHT = {"1w": 2.5, "1M": 2.5, "1d": 2.0}
+
+
+def _classify_regime(trends: dict[str, TrendFacts]) -> str:
     """Classify overall market regime from higher TFs."""
-    for tf in ("1d", "4h"):
-        trend = per_tf_facts.get(tf, {}).get("trend", {})
-        if not trend:
-            continue
-        if trend.get("is_sideway"):
+    return _classify_regime_cached(tuple(trends.get(tf) for tf in _REGIME_TFS))
+
+
+@lru_cache(maxsize=128)
+def _classify_regime_cached(regime_trends: tuple[TrendFacts | None, ...]) -> str:
+    """Memoized body of _classify_regime, keyed on the (hashable) 1d/4h facts."""
+    for trend in regime_trends:
+        if trend is None or trend.is_sideway:
             continue
-        d = trend.get("trend_dir", "sideway")
-        if d == "up":
+        if trend.trend_dir == "up":
             return "uptrend"
-        if d == "down":
+        if trend.trend_dir == "down":
             return "downtrend"
     return "ranging"
 
@@ -33,33 +46,41 @@ def _merge_levels(per_tf_facts: dict, max_levels: int = 5) -> list[dict]:
     Micro TFs (4h, 1h, 15m): score × 1.0
     Dedup within 1% proximity → keep highest scored.
     """
-    MACRO_WEIGHT = {"1w": 2.5, "1M": 2.5, "1d": 2.0}
     all_levels: list[dict] = []
 
-    for tf in ("1w", "1M", "1d", "4h", "1h", "15m"):
-        tf_data = per_tf_facts.get(tf, {})
-        sr = tf_data.get("sr", {})
-        weight = MACRO_WEIGHT.get(tf, 1.0)
-        for lv in sr.get("levels", []):
+    get_tf = per_tf_facts.get
+    for tf in _ALL_TFS:
+        levels = get_tf(tf, {}).get("sr", {}).get("levels", ())
+        if not levels:
+            continue
+        weight = _MACRO_WEIGHT.get(tf, 1.0)
+        for lv in levels:
             all_levels.append(
                 {
                     "price": lv["price"],
                     "kind": lv["kind"],
-                    "score": round(lv.get("score", 0) * weight, 4),
+                    "score": lv.get("score", 0) * weight,
                     "touches": lv.get("touches", 0),
                     "source_tf": tf,
                 }
             )
 
-    # Sort by weighted score desc
+    # Sort by weighted score desc (rounded only on the few levels that survive)
     all_levels.sort(key=lambda x: x["score"], reverse=True)
 
-    # Dedup within 1% proximity
+    # Dedup within 1% proximity. Kept prices live in a sorted list, so each
+    # candidate is only checked against the few neighbours inside its 1% window.
     merged: list[dict] = []
+    kept_prices: list[float] = []
     for lv in all_levels:
-        too_close = any(abs(lv["price"] - m["price"]) / max(m["price"], 1) < 0.01 for m in merged)
+        price = lv["price"]
+        lo = bisect_left(kept_prices, price / 1.01 - 0.01)
+        hi = bisect_right(kept_prices, price / 0.99 + 0.01)
+        too_close = any(abs(price - m) / max(m, 1) < 0.01 for m in kept_prices[lo:hi])
         if not too_close:
+            lv["score"] = round(lv["score"], 4)
             merged.append(lv)
+            insort(kept_prices, price)
         if len(merged) >= max_levels:
             break
 
@@ -70,64 +91,70 @@ def build_payload(
     symbol: str,
     as_of: datetime,
     per_tf_facts: dict[str, dict],
+    trends: dict[str, TrendFacts] | None = None,
 ) -> dict:
     """Combine per-TF trend+SR facts into a single LLM-ready payload.
 
+    Args:
+        trends: optional precomputed ``trend_table(per_tf_facts)``.
+
     Returns JSON-serializable dict with:
         symbol, as_of, regime, bias_chain, trends, key_levels, invalidation
     """
+    # Flatten per-TF trend facts once; everything below reads from this table
+    tf_trends = trend_table(per_tf_facts) if trends is None else trends
+
     # Current price approximation
     current_price: float | None = None
-    for tf in ("15m", "1h", "4h", "1d", "1w"):
-        trend = per_tf_facts.get(tf, {}).get("trend", {})
-        if "ema_fast" in trend:
-            current_price = trend["ema_fast"]
+    for tf in _PRICE_TFS:
+        trend = tf_trends.get(tf)
+        if trend is not None and trend.ema_fast is not None:
+            current_price = trend.ema_fast
             break
 
     # Regime
-    regime = _classify_regime(per_tf_facts)
+    regime = _classify_regime(tf_trends)
 
     # Bias chain
-    bias_chain = compute_bias_chain(per_tf_facts)
+    bias_chain = compute_bias_chain(per_tf_facts, tf_trends)
 
     # Trend summary per TF
     trends: dict = {}
-    for tf in ("1w", "1M", "1d", "4h", "1h", "15m"):
-        trend = per_tf_facts.get(tf, {}).get("trend", {})
-        if trend:
+    for tf in _ALL_TFS:
+        trend = tf_trends.get(tf)
+        if trend is not None:
             trends[tf] = {
-                "dir": trend.get("trend_dir"),
-                "strength": trend.get("trend_strength"),
-                "atr_pct": trend.get("atr_pct"),
-                "sideway": trend.get("is_sideway"),
+                "dir": trend.trend_dir,
+                "strength": trend.trend_strength,
+                "atr_pct": trend.atr_pct,
+                "sideway": trend.is_sideway,
             }
 
     # Key levels (macro/micro merged)
     key_levels = _merge_levels(per_tf_facts, max_levels=5)
 
-    # Invalidation
-    supports_below = sorted(
-        [
-            lv
-            for lv in key_levels
-            if lv["kind"] == "support" and current_price and lv["price"] < current_price
-        ],
-        key=lambda x: x["price"],
-        reverse=True,
-    )
-    resistances_above = sorted(
-        [
-            lv
-            for lv in key_levels
-            if lv["kind"] == "resistance" and current_price and lv["price"] > current_price
-        ],
-        key=lambda x: x["price"],
-    )
-
-    invalidation = {
-        "bull_above": resistances_above[0]["price"] if resistances_above else None,
-        "bear_below": supports_below[0]["price"] if supports_below else None,
-    }
+    # Invalidation: nearest support below / resistance above current price
+    bull_above: float | None = None
+    bear_below: float | None = None
+    if current_price:
+        bull_above = min(
+            (
+                lv["price"]
+                for lv in key_levels
+                if lv["kind"] == "resistance" and lv["price"] > current_price
+            ),
+            default=None,
+        )
+        bear_below = max(
+            (
+                lv["price"]
+                for lv in key_levels
+                if lv["kind"] == "support" and lv["price"] < current_price
+            ),
+            default=None,
+        )
+
+    invalidation = {"bull_above": bull_above, "bear_below": bear_below}
 
     return {
         "symbol": symbol,
@@ -0,0 +1,40 @@
+"""One-shot analysis pipeline: per-TF facts → payload, plan, evidence.
+
+Runs build_payload → build_plan → explain_plan in memory, flattening the
+per-TF trend facts once and sharing that table across stages instead of
+letting each stage re-derive it from the nested dicts.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from .explainer import explain_plan
+from .payload import build_payload
+from .plan_builder import build_plan
+from .trend import trend_table
+
+
+def build_full(
+    symbol: str,
+    as_of: datetime,
+    per_tf_facts: dict[str, dict],
+    risk_params: dict | None = None,
+) -> tuple[dict, dict, list[str]]:
+    """Build payload, trade plan and evidence lines in one pass.
+
+    Args:
+        symbol:       e.g. 'BTCUSDT'
+        as_of:        analysis snapshot time
+        per_tf_facts: {interval: {"trend": {...}, "sr": {...}}}
+        risk_params:  forwarded to build_plan()
+
+    Returns:
+        (payload, plan, evidence) — same values as calling the three stages
+        separately on the payload.
+    """
+    trends = trend_table(per_tf_facts)
+    payload = build_payload(symbol, as_of, per_tf_facts, trends=trends)
+    plan = build_plan(payload, risk_params, trends=trends)
+    evidence = explain_plan(payload, plan)
+    return payload, plan, evidence
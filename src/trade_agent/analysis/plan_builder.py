@@ -12,36 +12,42 @@ Generates a structured trade plan from market_facts payload:
 from __future__ import annotations
 
 from datetime import datetime
+from operator import itemgetter
 
+from .trend import TrendFacts, trend_table
 
-def _get_current_price(facts: dict) -> float | None:
-    """Extract current price approximation from facts payload."""
-    for tf in ("15m", "1h", "4h", "1d"):
-        trend = facts.get("timeframes", {}).get(tf, {}).get("trend", {})
-        if "ema_fast" in trend:
-            return trend["ema_fast"]
-    return None
+# Entry TFs probed (micro → macro) for the current price approximation
+_PRICE_TFS = ("15m", "1h", "4h", "1d")
 
 
-def _get_atr_pct(facts: dict, tf: str = "4h") -> float:
-    """Get ATR% for a given timeframe."""
-    trend = facts.get("timeframes", {}).get(tf, {}).get("trend", {})
-    return trend.get("atr_pct", 2.0)
+def _get_current_price(trends: dict[str, TrendFacts]) -> float | None:
+    """Extract current price approximation from the per-TF trend table."""
+    for tf in _PRICE_TFS:
+        trend = trends.get(tf)
+        if trend is not None and trend.ema_fast is not None:
+            return trend.ema_fast
+    return None
 
 
-def _sorted_levels(facts: dict, kind: str) -> list[dict]:
-    """Get key_levels sorted by price (asc for support, desc for resistance)."""
-    levels = [lv for lv in facts.get("key_levels", []) if lv["kind"] == kind]
-    reverse = kind == "resistance"
-    return sorted(levels, key=lambda x: x["price"], reverse=reverse)
+def _get_atr_pct(trends: dict[str, TrendFacts], tf: str = "4h") -> float:
+    """Get ATR% for a given timeframe."""
+    trend = trends.get(tf)
+    if trend is None or trend.atr_pct is None:
+        return 2.0
+    return trend.atr_pct
 
 
-def build_plan(facts: dict, risk_params: dict | None = None) -> dict:
+def build_plan(
+    facts: dict,
+    risk_params: dict | None = None,
+    trends: dict[str, TrendFacts] | None = None,
+) -> dict:
     """Build a trade plan from precomputed facts payload.
 
     Args:
         facts:       market_facts payload (interval='ALL')
         risk_params: override defaults {atr_stop_mult, min_rr, time_stop_bars, max_atr_pct}
+        trends:      optional precomputed ``trend_table(facts["timeframes"])``
 
     Returns:
         Plan dict with scenarios, entries, stops, targets, no_trade conditions.
@@ -55,18 +61,28 @@ def build_plan(facts: dict, risk_params: dict | None = None) -> dict:
         **(risk_params or {}),
     }
 
-    price = _get_current_price(facts)
+    if trends is None:
+        trends = trend_table(facts.get("timeframes", {}))
+    price = _get_current_price(trends)
     if price is None:
         return {"error": "Cannot determine current price from facts"}
 
     regime = facts.get("regime", "ranging")
     bias_chain = facts.get("bias_chain", {})
     inv = facts.get("invalidation", {})
-    atr_pct_4h = _get_atr_pct(facts, "4h")
-    atr_pct_1d = _get_atr_pct(facts, "1d")
-
-    supports = _sorted_levels(facts, "support")
-    resistances = _sorted_levels(facts, "resistance")
+    atr_pct_4h = _get_atr_pct(trends, "4h")
+    atr_pct_1d = _get_atr_pct(trends, "1d")
+
+    # Split key_levels in one pass: supports asc, resistances desc by price
+    supports: list[dict] = []
+    resistances: list[dict] = []
+    for lv in facts.get("key_levels", []):
+        if lv["kind"] == "support":
+            supports.append(lv)
+        elif lv["kind"] == "resistance":
+            resistances.append(lv)
+    supports.sort(key=itemgetter("price"))
+    resistances.sort(key=itemgetter("price"), reverse=True)
 
     # ATR in absolute terms (approx)
     atr_abs = price * atr_pct_4h / 100
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
 
-from .indicators import atr  # unchanged import
+from .._jit import HAS_BOTTLENECK, HAS_NUMBA, move_max, move_min, njit
+from .indicators import _ewm_nb, cached_atr
 
 
 # ── defaults ────────────────────────────────────────────────────────────────
@@ -38,7 +39,7 @@ class _Level:
     kind: str  # 'support' | 'resistance'
     touches: int = 1
     last_bar: int = 0
-    scores: list[float] = field(default_factory=list)
+    score_sum: float = 0.0  # summed member pivot scores
     structural: bool = False  # confirmed by LL / HH
     flipped: bool = False  # role changed after BOS
 
@@ -58,8 +59,40 @@ def _calc_rsi(close: pd.Series, period: int = 14) -> pd.Series:
 
 def _calc_wma(series: pd.Series, period: int) -> pd.Series:
     """Weighted Moving Average (linear weights, heavier on recent)."""
-    w = np.arange(1, period + 1, dtype=float)
-    return series.rolling(period).apply(lambda x: np.dot(x, w) / w.sum(), raw=True)
+    arr = series.to_numpy(dtype=np.float64)
+    out = np.full(arr.size, np.nan)
+    if arr.size >= period:
+        w = np.arange(1, period + 1, dtype=np.float64)
+        # convolve flips the kernel, so reverse w to put the heaviest weight on the newest bar;
+        # a NaN poisons exactly the windows that contain it, as rolling(period) would
+        out[period - 1 :] = np.convolve(arr, w[::-1], mode="valid") / w.sum()
+    return pd.Series(out, index=series.index)
+
+
+@njit(cache=True)
+def _hayden_core_nb(
+    close: np.ndarray, rsi_p: int, fast: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compiled (rsi, EMA(rsi, fast), EMA(close, fast)); same values as the pandas path."""
+    n = close.shape[0]
+    gain = np.full(n, np.nan)
+    loss = np.full(n, np.nan)
+    for i in range(1, n):
+        d = close[i] - close[i - 1]
+        if not np.isnan(d):
+            gain[i] = max(d, 0.0)
+            loss[i] = max(-d, 0.0)
+    avg_g = _ewm_nb(gain, 1.0 / rsi_p, rsi_p)
+    avg_l = _ewm_nb(loss, 1.0 / rsi_p, rsi_p)
+    rsi = np.empty(n)
+    for i in range(n):
+        # avg_l == 0 → undefined, as _calc_rsi's replace(0, nan)
+        if avg_l[i] == 0 or np.isnan(avg_l[i]):
+            rsi[i] = np.nan
+        else:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_g[i] / avg_l[i])
+    alpha = 2.0 / (fast + 1)
+    return rsi, _ewm_nb(rsi, alpha, 0), _ewm_nb(close, alpha, 0)
 
 
 def _hayden_rsi(close: pd.Series, rsi_p: int, fast: int, slow: int) -> pd.DataFrame:
@@ -67,21 +100,31 @@ def _hayden_rsi(close: pd.Series, rsi_p: int, fast: int, slow: int) -> pd.DataFr
     Compute Hayden RSI system columns:
       rsi, ema_fast, wma_slow, regime, bull_zone, bear_zone
     """
-    rsi = _calc_rsi(close, rsi_p)
-    ema_fast = rsi.ewm(span=fast, adjust=False).mean()
+    if HAS_NUMBA:
+        rsi_a, ema_a, price_ema_a = _hayden_core_nb(close.to_numpy(dtype=np.float64), rsi_p, fast)
+        rsi = pd.Series(rsi_a, index=close.index)
+        ema_fast = pd.Series(ema_a, index=close.index)
+        price_ema = pd.Series(price_ema_a, index=close.index)
+    else:
+        rsi = _calc_rsi(close, rsi_p)
+        ema_fast = rsi.ewm(span=fast, adjust=False).mean()
+        price_ema = close.ewm(span=fast, adjust=False).mean()
     wma_slow = _calc_wma(rsi, slow)
-
-    price_ema = close.ewm(span=fast, adjust=False).mean()
     price_wma = _calc_wma(close, slow)
 
     price_bull = price_ema > price_wma
     rsi_bull = ema_fast > wma_slow
 
-    regime = pd.Series("UNDEFINED", index=close.index)
-    regime[price_bull & rsi_bull] = "UP"
-    regime[~price_bull & ~rsi_bull] = "DOWN"
-    regime[price_bull & ~rsi_bull] = "SIDEWAYS_UP"
-    regime[~price_bull & rsi_bull] = "SIDEWAYS_DOWN"
+    pb = price_bull.to_numpy()
+    rb = rsi_bull.to_numpy()
+    regime = pd.Series(
+        np.select(
+            [pb & rb, ~pb & ~rb, pb & ~rb, ~pb & rb],
+            ["UP", "DOWN", "SIDEWAYS_UP", "SIDEWAYS_DOWN"],
+            default="UNDEFINED",
+        ),
+        index=close.index,
+    )
 
     bull_zone = (rsi >= 40) & (rsi <= 82)  # Hayden 40–80 bull range
     bear_zone = (rsi >= 18) & (rsi <= 62)  # Hayden 20–60 bear range
@@ -98,118 +141,201 @@ def _hayden_rsi(close: pd.Series, rsi_p: int, fast: int, slow: int) -> pd.DataFr
     )
 
 
-def _rsi_score_at(rsi_df: pd.DataFrame, bar_idx: int, kind: str) -> float:
+def _rsi_scores(rsi_df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
     """
-    Return RSI bonus score for a swing pivot at bar_idx.
+    Per-bar RSI bonus score for (resistance, support) swing pivots.
     Bonus if:
       - resistance pivot AND regime UP/SIDEWAYS_UP (Hayden: simple bearish
         divergence confirms uptrend → resistance hit = uptrend retest)
       - support pivot AND regime DOWN/SIDEWAYS_DOWN
       - RSI in the appropriate bull/bear zone
+    Both conditions → 1.0, one → 0.5, neither → 0.0.
     """
-    if bar_idx >= len(rsi_df):
-        return 0.0
-    row = rsi_df.iloc[bar_idx]
-    regime = row["regime"]
-
-    if kind == "resistance":
-        regime_ok = regime in ("UP", "SIDEWAYS_UP")
-        zone_ok = bool(row["bull_zone"])
-    else:
-        regime_ok = regime in ("DOWN", "SIDEWAYS_DOWN")
-        zone_ok = bool(row["bear_zone"])
-
-    return 1.0 if (regime_ok and zone_ok) else (0.5 if (regime_ok or zone_ok) else 0.0)
+    regime = rsi_df["regime"]
+    up_ok = regime.isin(("UP", "SIDEWAYS_UP")).to_numpy()
+    down_ok = regime.isin(("DOWN", "SIDEWAYS_DOWN")).to_numpy()
+    bull_zone = rsi_df["bull_zone"].to_numpy(dtype=bool)
+    bear_zone = rsi_df["bear_zone"].to_numpy(dtype=bool)
+    resistance = (up_ok.astype(np.float64) + bull_zone) * 0.5
+    support = (down_ok.astype(np.float64) + bear_zone) * 0.5
+    return resistance, support
 
 
 # ── pivot helpers ────────────────────────────────────────────────────────────
+@njit(cache=True)
+def _strict_peaks_nb(values: np.ndarray, n: int) -> np.ndarray:
+    """Scalar-loop twin of _strict_peaks with early exit; compiled when Numba is present."""
+    out = np.empty(values.shape[0], dtype=np.int64)
+    k = 0
+    for i in range(n, values.shape[0] - n):
+        c = values[i]
+        peak = True
+        for j in range(1, n + 1):
+            # `not >` rather than `<=` so NaN neighbours reject the pivot
+            if not (c > values[i - j] and c > values[i + j]):
+                peak = False
+                break
+        if peak:
+            out[k] = i
+            k += 1
+    return out[:k]
+
+
+def _strict_peaks(values: np.ndarray, n: int) -> np.ndarray:
+    """Indices i where values[i] is strictly greater than its n neighbours on each side."""
+    if HAS_NUMBA:
+        return _strict_peaks_nb(values, n)
+    if len(values) < 2 * n + 1:
+        return np.empty(0, dtype=np.intp)
+    if n == 2:
+        # default fractal: four shifted comparisons, no window materialisation
+        c = values[2:-2]
+        mask = (c > values[:-4]) & (c > values[1:-3]) & (c > values[3:-1]) & (c > values[4:])
+        return np.flatnonzero(mask) + 2
+    if HAS_BOTTLENECK and n >= 1:
+        # mm[j] = max(values[j-n+1 : j+1]); NaN if the window holds a NaN
+        mm = move_max(values, n)
+        size = len(values)
+        center = values[n : size - n]
+        left = mm[n - 1 : size - n - 1]
+        right = mm[2 * n :]
+        return np.flatnonzero((center > left) & (center > right)) + n
+    win = np.lib.stride_tricks.sliding_window_view(values, 2 * n + 1)
+    center = win[:, n]
+    # NaN anywhere in the window (or at the centre) fails the comparison, as in a scalar loop
+    left = win[:, :n].max(axis=1, initial=-np.inf)
+    right = win[:, n + 1 :].max(axis=1, initial=-np.inf)
+    return np.flatnonzero((center > left) & (center > right)) + n
+
+
 def _pivot_highs(df: pd.DataFrame, n: int) -> list[tuple[int, float]]:
-    highs, out = df["high"].values, []
-    for i in range(n, len(highs) - n):
-        if all(highs[i] > highs[i - j] for j in range(1, n + 1)) and all(
-            highs[i] > highs[i + j] for j in range(1, n + 1)
-        ):
-            out.append((i, highs[i]))
-    return out
+    highs = df["high"].to_numpy(dtype=np.float64)
+    idx = _strict_peaks(highs, n)
+    return list(zip(idx.tolist(), highs[idx].tolist(), strict=True))
 
 
 def _pivot_lows(df: pd.DataFrame, n: int) -> list[tuple[int, float]]:
-    lows, out = df["low"].values, []
-    for i in range(n, len(lows) - n):
-        if all(lows[i] < lows[i - j] for j in range(1, n + 1)) and all(
-            lows[i] < lows[i + j] for j in range(1, n + 1)
-        ):
-            out.append((i, lows[i]))
-    return out
+    lows = df["low"].to_numpy(dtype=np.float64)
+    idx = _strict_peaks(-lows, n)
+    return list(zip(idx.tolist(), lows[idx].tolist(), strict=True))
 
 
 # ── structural swing validation ──────────────────────────────────────────────
-def _is_structural_high(
-    bar_idx: int,
-    high_price: float,
-    df: pd.DataFrame,
-    lows: list[tuple[int, float]],
-    confirm_bars: int,
-) -> bool:
-    """
-    A pivot high is structural if, after it, price creates a LL
-    (low < last swing low before the pivot).
+def _forward_windows(values: np.ndarray, confirm_bars: int, fill: float) -> np.ndarray:
+    """Row i views ``values[i+1 : i+confirm_bars]``, padded with ``fill`` past the end."""
+    width = confirm_bars - 1
+    padded = np.concatenate([values[1:], np.full(width, fill)])
+    return np.lib.stride_tricks.sliding_window_view(padded, width)
+
+
+def _forward_min(lows: np.ndarray, confirm_bars: int) -> np.ndarray:
+    """Lowest low in the confirmation window after each bar (+inf if empty)."""
+    if confirm_bars <= 1:
+        return np.full(len(lows), np.inf)
+    if HAS_BOTTLENECK:
+        width = confirm_bars - 1
+        padded = np.concatenate([lows[1:], np.full(width, np.inf)])
+        return move_min(padded, width)[width - 1 :]
+    return _forward_windows(lows, confirm_bars, np.inf).min(axis=1)
+
+
+def _forward_max(highs: np.ndarray, confirm_bars: int) -> np.ndarray:
+    """Highest high in the confirmation window after each bar (-inf if empty)."""
+    if confirm_bars <= 1:
+        return np.full(len(highs), -np.inf)
+    if HAS_BOTTLENECK:
+        width = confirm_bars - 1
+        padded = np.concatenate([highs[1:], np.full(width, -np.inf)])
+        return move_max(padded, width)[width - 1 :]
+    return _forward_windows(highs, confirm_bars, -np.inf).max(axis=1)
+
+
+def _structural(
+    bars: np.ndarray,
+    ref_bars: np.ndarray,
+    ref_prices: np.ndarray,
+    fwd_extreme: np.ndarray,
+    breaks_below: bool,
+) -> np.ndarray:
     """
-    # find reference low = latest swing low BEFORE this pivot
-    prior_lows = [p for p in lows if p[0] < bar_idx]
-    if not prior_lows:
-        return False
-    ref_low = prior_lows[-1][1]
-
-    # scan forward for LL
-    end = min(bar_idx + confirm_bars, len(df))
-    future_lows = df["low"].values[bar_idx + 1 : end]
-    return bool(len(future_lows) and future_lows.min() < ref_low)
-
-
-def _is_structural_low(
-    bar_idx: int,
-    low_price: float,
-    df: pd.DataFrame,
-    highs: list[tuple[int, float]],
-    confirm_bars: int,
-) -> bool:
+    Structural flags for swing pivots at ``bars``.
+
+    A pivot high is structural if, after it, price creates a LL (low < last
+    swing low before the pivot); a pivot low needs a HH. ``ref_bars`` /
+    ``ref_prices`` are the opposite swings (sorted by bar) and ``fwd_extreme``
+    the matching _forward_min / _forward_max.
     """
-    A pivot low is structural if, after it, price creates a HH
-    (high > last swing high before the pivot).
+    # reference swing = latest opposite swing BEFORE each pivot
+    k = np.searchsorted(ref_bars, bars) - 1
+    if ref_bars.size == 0:
+        return np.zeros(bars.size, dtype=bool)
+    ref = ref_prices[np.maximum(k, 0)]
+    fwd = fwd_extreme[bars]
+    broken = fwd < ref if breaks_below else fwd > ref
+    return (k >= 0) & broken
+
+
+# ── clustering ───────────────────────────────────────────────────────────────
+@njit(cache=True)
+def _cluster_sweep(
+    prices: np.ndarray, scores: np.ndarray, width: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    prior_highs = [p for p in highs if p[0] < bar_idx]
-    if not prior_highs:
-        return False
-    ref_high = prior_highs[-1][1]
+    Proximity sweep over price-sorted pivots.
 
-    end = min(bar_idx + confirm_bars, len(df))
-    future_highs = df["high"].values[bar_idx + 1 : end]
-    return bool(len(future_highs) and future_highs.max() > ref_high)
+    A pivot joins the current cluster if it lies within ``width`` of the
+    cluster's score-weighted price, otherwise it opens a new cluster. Returns
+    (first pivot index, weighted price, score sum) per cluster.
+    """
+    n = prices.shape[0]
+    starts = np.empty(n, dtype=np.int64)
+    centres = np.empty(n)
+    weights = np.empty(n)
+    k = 0
+    for i in range(n):
+        if k > 0 and abs(centres[k - 1] - prices[i]) <= width:
+            tot = weights[k - 1] + scores[i]
+            centres[k - 1] = (centres[k - 1] * weights[k - 1] + prices[i] * scores[i]) / tot
+            weights[k - 1] = tot
+        else:
+            starts[k] = i
+            centres[k] = prices[i]
+            weights[k] = scores[i]
+            k += 1
+    return starts[:k], centres[:k], weights[:k]
 
 
 # ── misc helpers ─────────────────────────────────────────────────────────────
-def _recency_weight(bar_idx: int, total: int, half_life: int) -> float:
-    age = total - 1 - bar_idx
-    return math.exp(-age * math.log(2) / max(half_life, 1))
-
-
-def _wick_score(df: pd.DataFrame, bar_idx: int, kind: str, threshold: float, bonus: float) -> float:
-    row = df.iloc[bar_idx]
-    bar_range = row["high"] - row["low"]
-    if bar_range <= 0:
-        return 0.0
-    if kind == "support":
-        wick = min(row["open"], row["close"]) - row["low"]
-    else:
-        wick = row["high"] - max(row["open"], row["close"])
-    return bonus if (wick / bar_range) >= threshold else 0.0
+def _recency_weights(total: int, half_life: int) -> np.ndarray:
+    """Per-bar recency weight: 1.0 on the last bar, halving every half_life bars."""
+    age = np.arange(total - 1, -1, -1, dtype=np.float64)
+    return np.exp(-age * math.log(2) / max(half_life, 1))
+
+
+def _ohlc_arrays(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Contiguous float64 (open, high, low, close), extracted once per compute_sr call."""
+    return tuple(
+        np.ascontiguousarray(df[col].to_numpy(dtype=np.float64))
+        for col in ("open", "high", "low", "close")
+    )
+
+
+def _wick_rejections(
+    o: np.ndarray, h: np.ndarray, lo: np.ndarray, c: np.ndarray, threshold: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-bar flags: (lower wick, upper wick) is at least ``threshold`` of the bar range."""
+    bar_range = h - lo
+    valid = bar_range > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lower = valid & ((np.minimum(o, c) - lo) / bar_range >= threshold)
+        upper = valid & ((h - np.maximum(o, c)) / bar_range >= threshold)
+    return lower, upper
 
 
 # ── BOS / flip detection ─────────────────────────────────────────────────────
 def _detect_flips(
     clusters: list[_Level],
-    df: pd.DataFrame,
+    closes: np.ndarray,
     current_price: float,
 ) -> None:
     """
@@ -218,17 +344,19 @@ def _detect_flips(
     A support level that price closed below → flipped to resistance.
     Mutates clusters in-place.
     """
-    closes = df["close"].values
+    # post_max[i] / post_min[i] = extreme close from bar i to the end
+    post_max = np.maximum.accumulate(closes[::-1])[::-1]
+    post_min = np.minimum.accumulate(closes[::-1])[::-1]
     for cl in clusters:
+        if cl.last_bar >= len(closes):
+            continue
         if cl.kind == "resistance" and current_price > cl.price:
             # check if any close after last_bar actually crossed above
-            post = closes[cl.last_bar :]
-            if len(post) and post.max() > cl.price:
+            if post_max[cl.last_bar] > cl.price:
                 cl.kind = "support"
                 cl.flipped = True
         elif cl.kind == "support" and current_price < cl.price:
-            post = closes[cl.last_bar :]
-            if len(post) and post.min() < cl.price:
+            if post_min[cl.last_bar] < cl.price:
                 cl.kind = "resistance"
                 cl.flipped = True
 
@@ -254,9 +382,10 @@ def compute_sr(df: pd.DataFrame, params: dict | None = None) -> dict:
     if total < max(2 * n + 5, p["rsi_wma_slow"] + 10):
         return {"levels": [], "zones": []}
 
-    atr_val = float(atr(df, p["atr_period"]).iloc[-1])
+    atr_val = float(cached_atr(df, p["atr_period"]).iloc[-1])
     cluster_width = tol * atr_val
-    current_price = float(df["close"].iloc[-1])
+    opens, highs, lows, closes = _ohlc_arrays(df)
+    current_price = float(closes[-1])
 
     # ── Hayden RSI ───────────────────────────────────────────────────────────
     rsi_df = _hayden_rsi(
@@ -266,104 +395,90 @@ def compute_sr(df: pd.DataFrame, params: dict | None = None) -> dict:
         p["rsi_wma_slow"],
     )
 
-    # ── raw pivots ───────────────────────────────────────────────────────────
-    raw_highs = _pivot_highs(df, n)
-    raw_lows = _pivot_lows(df, n)
-
-    pivots: list[_Level] = []
-
-    for idx, price in raw_highs:
-        structural = _is_structural_high(idx, price, df, raw_lows, p["confirm_bars"])
-        w = _recency_weight(idx, total, hl)
-        kind = "resistance" if price > current_price else "support"
-        wick = _wick_score(df, idx, kind, p["wick_threshold"], p["wick_bonus"])
-        rsi_bonus = _rsi_score_at(rsi_df, idx, kind) * p["rsi_score_bonus"]
-        # structural swings get a score multiplier
-        score = (w + wick + rsi_bonus) * (1.5 if structural else 1.0)
-        pivots.append(
-            _Level(
-                price=price,
-                kind=kind,
-                last_bar=idx,
-                scores=[score],
-                structural=structural,
-            )
-        )
-
-    for idx, price in raw_lows:
-        structural = _is_structural_low(idx, price, df, raw_highs, p["confirm_bars"])
-        w = _recency_weight(idx, total, hl)
-        kind = "support" if price < current_price else "resistance"
-        wick = _wick_score(df, idx, kind, p["wick_threshold"], p["wick_bonus"])
-        rsi_bonus = _rsi_score_at(rsi_df, idx, kind) * p["rsi_score_bonus"]
-        score = (w + wick + rsi_bonus) * (1.5 if structural else 1.0)
-        pivots.append(
-            _Level(
-                price=price,
-                kind=kind,
-                last_bar=idx,
-                scores=[score],
-                structural=structural,
-            )
-        )
-
-    if not pivots:
+    # ── raw pivots (struct-of-arrays: swing highs, then swing lows) ────────────
+    high_bars = _strict_peaks(highs, n)
+    low_bars = _strict_peaks(-lows, n)
+    if high_bars.size + low_bars.size == 0:
         return {"levels": [], "zones": []}
+    high_prices = highs[high_bars]
+    low_prices = lows[low_bars]
+
+    fwd_min = _forward_min(lows, p["confirm_bars"])
+    fwd_max = _forward_max(highs, p["confirm_bars"])
+    bars = np.concatenate([high_bars, low_bars])
+    prices = np.concatenate([high_prices, low_prices])
+    structural = np.concatenate(
+        [
+            _structural(high_bars, low_bars, low_prices, fwd_min, breaks_below=True),
+            _structural(low_bars, high_bars, high_prices, fwd_max, breaks_below=False),
+        ]
+    )
+    is_res = np.concatenate([high_prices > current_price, ~(low_prices < current_price)])
+
+    lower_wick, upper_wick = _wick_rejections(opens, highs, lows, closes, p["wick_threshold"])
+    rsi_res, rsi_sup = _rsi_scores(rsi_df)
+    wick = np.where(np.where(is_res, upper_wick[bars], lower_wick[bars]), p["wick_bonus"], 0.0)
+    rsi_bonus = np.where(is_res, rsi_res[bars], rsi_sup[bars]) * p["rsi_score_bonus"]
+    # structural swings get a score multiplier
+    recency = _recency_weights(total, hl)[bars]
+    scores = (recency + wick + rsi_bonus) * np.where(structural, 1.5, 1.0)
 
     # ── cluster by price proximity ───────────────────────────────────────────
-    pivots.sort(key=lambda x: x.price)
-    clusters: list[_Level] = []
-    for pv in pivots:
-        merged = False
-        for cl in reversed(clusters):
-            if abs(cl.price - pv.price) <= cluster_width:
-                w_cl = sum(cl.scores)
-                w_pv = sum(pv.scores)
-                tot = w_cl + w_pv
-                cl.price = (cl.price * w_cl + pv.price * w_pv) / tot
-                cl.touches += pv.touches
-                cl.last_bar = max(cl.last_bar, pv.last_bar)
-                cl.scores.extend(pv.scores)
-                cl.structural = cl.structural or pv.structural
-                merged = True
-                break
-        if not merged:
-            clusters.append(
-                _Level(
-                    price=pv.price,
-                    kind=pv.kind,
-                    touches=pv.touches,
-                    last_bar=pv.last_bar,
-                    scores=list(pv.scores),
-                    structural=pv.structural,
-                )
-            )
+    # Pivots are swept in price order and a cluster's price stays within its
+    # members' range, so only the most recent cluster can be within reach.
+    # The sweep fixes membership; per-cluster aggregates are then reductions.
+    order = np.argsort(prices, kind="stable")
+    starts, centres, score_sums = _cluster_sweep(prices[order], scores[order], cluster_width)
+    touches = np.diff(np.append(starts, len(order)))
+    last_bars = np.maximum.reduceat(bars[order], starts)
+    any_structural = np.logical_or.reduceat(structural[order], starts)
+    first_is_res = is_res[order][starts]
+
+    clusters = [
+        _Level(
+            price=price,
+            kind="resistance" if res else "support",
+            touches=touch,
+            last_bar=bar,
+            score_sum=score_sum,
+            structural=struct,
+        )
+        for price, res, touch, bar, score_sum, struct in zip(
+            centres.tolist(),
+            first_is_res.tolist(),
+            touches.tolist(),
+            last_bars.tolist(),
+            score_sums.tolist(),
+            any_structural.tolist(),
+            strict=True,
+        )
+    ]
 
     # ── BOS / flip ───────────────────────────────────────────────────────────
-    _detect_flips(clusters, df, current_price)
+    _detect_flips(clusters, closes, current_price)
 
     # ── sort & trim ──────────────────────────────────────────────────────────
-    def _score(cl: _Level) -> float:
-        return round(sum(cl.scores), 4)
-
-    clusters.sort(key=_score, reverse=True)
+    # sort on the rounded score so near-equal levels keep their price order
+    clusters.sort(key=lambda cl: round(cl.score_sum, 4), reverse=True)
     clusters = clusters[: p["max_levels"]]
 
     # ── build output ─────────────────────────────────────────────────────────
     timestamps = df.index
+    regimes = rsi_df["regime"].to_numpy()
+    band = max(cluster_width, atr_val * 0.1)
     levels, zones = [], []
 
     for cl in clusters:
         bar_idx = min(cl.last_bar, len(timestamps) - 1)
         last_ts = str(timestamps[bar_idx])
-        regime = str(rsi_df["regime"].iloc[bar_idx])
-        band = max(cluster_width, atr_val * 0.1)
+        regime = str(regimes[bar_idx])
+        score = round(cl.score_sum, 4)
 
         levels.append(
             {
                 "price": round(cl.price, 2),
                 "kind": cl.kind,
-                "score": _score(cl),
+                "score": score,
                 "touches": cl.touches,
                 "last_touched": last_ts,
                 "structural": cl.structural,  # ← NEW: LL/HH confirmed
@@ -376,7 +491,7 @@ def compute_sr(df: pd.DataFrame, params: dict | None = None) -> dict:
                 "kind": cl.kind,
                 "low": round(cl.price - band / 2, 2),
                 "high": round(cl.price + band / 2, 2),
-                "score": _score(cl),
+                "score": score,
                 "structural": cl.structural,
                 "flipped": cl.flipped,
             }
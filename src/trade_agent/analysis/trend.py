@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections import deque
+from dataclasses import dataclass, field
+
 import pandas as pd
 
-from .indicators import atr, ema
+from .indicators import cached_atr, ema
 
 
 _DEFAULT_PARAMS = {
@@ -38,7 +41,7 @@ def compute_trend(df: pd.DataFrame, params: dict | None = None) -> dict:
     close = df["close"]
     fast = ema(close, p["ema_fast"])
     slow = ema(close, p["ema_slow"])
-    atr_s = atr(df, p["atr_period"])
+    atr_s = cached_atr(df, p["atr_period"])
 
     # Use last valid values
     c = float(close.iloc[-1])
@@ -46,9 +49,15 @@ def compute_trend(df: pd.DataFrame, params: dict | None = None) -> dict:
     s = float(slow.iloc[-1])
     a = float(atr_s.iloc[-1])
 
-    # Slope of slow EMA over last N bars (as % per bar)
+    # Slow EMA slope_bars ago (falls back to the last value on short frames)
     n = p["slope_bars"]
     s_prev = float(slow.iloc[-(n + 1)]) if len(slow) > n else s
+    return _trend_facts(c, f, s, s_prev, a, p)
+
+
+def _trend_facts(c: float, f: float, s: float, s_prev: float, a: float, p: dict) -> dict:
+    """Assemble the compute_trend dict from last close / EMAs / ATR."""
+    # Slope of slow EMA over last N bars (as % per bar)
     slope_pct = ((s - s_prev) / s_prev * 100) if s_prev != 0 else 0.0
 
     dist = (c - s) / a if a > 0 else 0.0
@@ -78,3 +87,99 @@ def compute_trend(df: pd.DataFrame, params: dict | None = None) -> dict:
         "dist_to_slow": round(dist, 4),
         "is_sideway": is_sideway,
     }
+
+
+# ── Streaming ────────────────────────────────────────────────────────────────
+
+
+def _ewm_step(prev: float | None, x: float, alpha: float) -> float:
+    """One ``ewm(adjust=False)`` step, in pandas' exact arithmetic form."""
+    if prev is None:
+        return x
+    if prev == x:
+        return prev
+    keep = 1.0 - alpha
+    return (keep * prev + alpha * x) / (keep + alpha)
+
+
+@dataclass
+class TrendState:
+    """Running EMA/ATR state for update_trend(); one per symbol/timeframe."""
+
+    params: dict
+    ema_fast: float | None = None
+    ema_slow: float | None = None
+    atr: float | None = None
+    prev_close: float | None = None
+    slow_hist: deque[float] = field(default_factory=deque)
+
+    def __post_init__(self) -> None:
+        # Fill missing params and bound slow_hist to slope_bars + 1 however the
+        # state was built; an unbounded deque would pin slope_pct at 0.
+        self.params = {**_DEFAULT_PARAMS, **self.params}
+        maxlen = self.params["slope_bars"] + 1
+        if self.slow_hist.maxlen != maxlen:
+            self.slow_hist = deque(self.slow_hist, maxlen=maxlen)
+
+
+def trend_state(params: dict | None = None) -> TrendState:
+    """Fresh streaming state using compute_trend's params."""
+    return TrendState(params=params or {})
+
+
+def update_trend(state: TrendState, high: float, low: float, close: float) -> dict:
+    """Fold one closed bar into ``state`` in O(1) and return its trend facts.
+
+    After feeding a frame bar by bar, the result equals ``compute_trend(df)``
+    for the same params (gap-free bars assumed).
+    """
+    p = state.params
+    tr = high - low
+    if state.prev_close is not None:
+        tr = max(tr, abs(high - state.prev_close), abs(low - state.prev_close))
+    state.atr = _ewm_step(state.atr, tr, 1 / p["atr_period"])
+    state.ema_fast = _ewm_step(state.ema_fast, close, 2 / (p["ema_fast"] + 1))
+    state.ema_slow = _ewm_step(state.ema_slow, close, 2 / (p["ema_slow"] + 1))
+    state.prev_close = close
+    state.slow_hist.append(state.ema_slow)
+
+    s = state.ema_slow
+    hist = state.slow_hist
+    s_prev = hist[0] if len(hist) == hist.maxlen else s
+    return _trend_facts(close, state.ema_fast, s, s_prev, state.atr, p)
+
+
+@dataclass(frozen=True)
+class TrendFacts:
+    """Flat, read-only view of one timeframe's ``compute_trend`` output.
+
+    Fields missing from the source dict are None, matching ``dict.get``.
+    """
+
+    trend_dir: str | None = None
+    trend_strength: float | None = None
+    atr_pct: float | None = None
+    is_sideway: bool | None = None
+    ema_fast: float | None = None
+
+    @classmethod
+    def from_dict(cls, trend: dict) -> TrendFacts:
+        return cls(
+            trend_dir=trend.get("trend_dir"),
+            trend_strength=trend.get("trend_strength"),
+            atr_pct=trend.get("atr_pct"),
+            is_sideway=trend.get("is_sideway"),
+            ema_fast=trend.get("ema_fast"),
+        )
+
+
+def trend_table(per_tf_facts: dict) -> dict[str, TrendFacts]:
+    """Build {tf: TrendFacts} once from {tf: {"trend": {...}, ...}}.
+
+    Timeframes without (or with empty) trend facts are left out.
+    """
+    return {
+        tf: TrendFacts.from_dict(tf_data["trend"])
+        for tf, tf_data in per_tf_facts.items()
+        if tf_data.get("trend")
+    }
@@ -5,9 +5,15 @@ Implements oscillator state machine (momentum → correction → entry).
 
 from __future__ import annotations
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import pandas as pd
 
+from .._jit import HAS_BOTTLENECK, HAS_NUMBA, move_max, move_min, njit, prange
+from .._memo import ContentMemo, fingerprint
+
 # ---------------------------------------------------------------------------
 # Bias / zone helpers
 # ---------------------------------------------------------------------------
@@ -56,8 +62,50 @@ def _price_near_zone(price: float, zones: list[dict], zone_mult: float = 1.5) ->
 # ---------------------------------------------------------------------------
 
 
+@njit(cache=True)
+def _wilder_rsi(close: np.ndarray, period: int) -> np.ndarray:
+    """One-pass port of the pandas path in _calc_rsi.
+
+    Gains and losses are smoothed with pandas' ``ewm(com=period-1,
+    min_periods=period)`` (adjust=True) recurrence; both share one NaN
+    pattern and so one weight. Undefined bars (warm-up, no losses) are 50.
+    """
+    n = close.shape[0]
+    out = np.full(n, 50.0)
+    old_wt_factor = 1.0 - 1.0 / period
+    avg_gain = np.nan
+    avg_loss = np.nan
+    old_wt = 1.0
+    nobs = 0
+    for i in range(1, n):
+        d = close[i] - close[i - 1]
+        if np.isnan(d):
+            if not np.isnan(avg_gain):
+                old_wt *= old_wt_factor
+        else:
+            nobs += 1
+            g = max(d, 0.0)
+            lo = max(-d, 0.0)
+            if np.isnan(avg_gain):
+                avg_gain = g
+                avg_loss = lo
+            else:
+                old_wt *= old_wt_factor
+                if avg_gain != g:
+                    avg_gain = (old_wt * avg_gain + g) / (old_wt + 1.0)
+                if avg_loss != lo:
+                    avg_loss = (old_wt * avg_loss + lo) / (old_wt + 1.0)
+                old_wt += 1.0
+        if nobs >= period and avg_loss != 0 and not np.isnan(avg_gain):
+            out[i] = 100 - (100 / (1 + avg_gain / avg_loss))
+    return out
+
+
 def _calc_rsi(close: pd.Series, period: int = 14) -> pd.Series:
     """Wilder-smoothed RSI."""
+    if HAS_NUMBA:
+        out = _wilder_rsi(close.to_numpy(dtype=np.float64), period)
+        return pd.Series(out, index=close.index)
     delta = close.diff()
     gain = delta.clip(lower=0)
     loss = -delta.clip(upper=0)
@@ -73,13 +121,18 @@ def _calc_ema(series: pd.Series, period: int) -> pd.Series:
 
 
 def _calc_wma(series: pd.Series, period: int) -> pd.Series:
-    weights = np.arange(1, period + 1, dtype=float)
-
-    def _wma(x: np.ndarray) -> float:
-        w = weights[-len(x) :]
-        return float((x * w).sum() / w.sum())
-
-    return series.rolling(window=period, min_periods=1).apply(_wma, raw=True)
+    """Linear WMA; the first period-1 bars use the shorter window (min_periods=1)."""
+    arr = series.to_numpy(dtype=np.float64)
+    out = np.full(arr.size, np.nan)
+    if arr.size:
+        w = np.arange(period, 0, -1, dtype=np.float64)  # newest bar weighs `period`
+        # "full" mode zero-pads the front, so bar i < period only sees its i+1
+        # bars with the top weights; divide by the matching partial weight sum
+        den = np.full(arr.size, w.sum())
+        k = min(period, arr.size)
+        den[:k] = np.cumsum(w[:k])
+        out = np.convolve(arr, w, mode="full")[: arr.size] / den
+    return pd.Series(out, index=series.index)
 
 
 def _detect_divergence(price: pd.Series, rsi: pd.Series, lookback: int = 10) -> pd.Series:
@@ -90,17 +143,23 @@ def _detect_divergence(price: pd.Series, rsi: pd.Series, lookback: int = 10) ->
        -1 = bearish divergence (price higher-high, RSI lower-high)
         0 = none
     """
-    div = pd.Series(0, index=price.index, dtype=int)
-    p = price.to_numpy()
-    r = rsi.to_numpy()
-    for i in range(lookback, len(p)):
-        p_win = p[i - lookback : i + 1]
-        r_win = r[i - lookback : i + 1]
-        if p_win[-1] == p_win.max() and r_win[-1] < r_win.max():
-            div.iloc[i] = -1
-        elif p_win[-1] == p_win.min() and r_win[-1] > r_win.min():
-            div.iloc[i] = 1
-    return div
+    # Windows are the current bar plus `lookback` prior bars; incomplete or
+    # NaN-holding windows roll to NaN and never compare true
+    window = lookback + 1
+    p = price.to_numpy(dtype=np.float64)
+    r = rsi.to_numpy(dtype=np.float64)
+    if HAS_BOTTLENECK and window <= p.size:
+        p_max, p_min = move_max(p, window), move_min(p, window)
+        r_max, r_min = move_max(r, window), move_min(r, window)
+    else:
+        p_win = pd.Series(p).rolling(window)
+        r_win = pd.Series(r).rolling(window)
+        p_max, p_min = p_win.max().to_numpy(), p_win.min().to_numpy()
+        r_max, r_min = r_win.max().to_numpy(), r_win.min().to_numpy()
+    bearish = (p == p_max) & (r < r_max)
+    bullish = (p == p_min) & (r > r_min)
+    div = np.where(bearish, -1, np.where(bullish, 1, 0))
+    return pd.Series(div, index=price.index, dtype=int)
 
 
 # ---------------------------------------------------------------------------
@@ -108,25 +167,23 @@ def _detect_divergence(price: pd.Series, rsi: pd.Series, lookback: int = 10) ->
 # ---------------------------------------------------------------------------
 
 
-def _long_signals(
-    rsi: pd.Series,
-    rsi_ema: pd.Series,
-    rsi_wma: pd.Series,
-    div: pd.Series,
-    p: dict,
-) -> pd.Series:
-    """State machine for LONG signals in an uptrend.
+# State-machine states (ints so the loops compile under Numba)
+_IDLE, _MOMENTUM, _CORRECTION, _HOLD = 0, 1, 2, 3
 
-    States: idle → momentum → correction → ENTRY(+1) → hold → idle
-    """
-    n = len(rsi)
-    pos_arr = np.zeros(n, dtype=np.int8)
-    state = "idle"
 
-    rsi_arr = rsi.to_numpy()
-    ema_arr = rsi_ema.to_numpy()
-    wma_arr = rsi_wma.to_numpy()
-    div_arr = div.to_numpy()
+@njit(cache=True)
+def _long_sm(
+    rsi_arr: np.ndarray,
+    ema_arr: np.ndarray,
+    wma_arr: np.ndarray,
+    div_arr: np.ndarray,
+    momentum_long: float,
+    sideway_low: float,
+) -> np.ndarray:
+    """Bar loop behind _long_signals; plain Python when Numba is missing."""
+    n = len(rsi_arr)
+    pos_arr = np.zeros(n, dtype=np.int8)
+    state = _IDLE
 
     for i in range(1, n):
         rv = rsi_arr[i]
@@ -136,57 +193,54 @@ def _long_signals(
         ev_prev = ema_arr[i - 1]
         dv = div_arr[i]
 
-        if state == "idle":
-            if rv >= p["rsi_momentum_long"]:
-                state = "momentum"
+        if state == _IDLE:
+            if rv >= momentum_long:
+                state = _MOMENTUM
 
-        elif state == "momentum":
-            if rv >= p["rsi_momentum_long"]:
+        elif state == _MOMENTUM:
+            if rv >= momentum_long:
                 pass
             elif rv < ev and rv < wv:
-                state = "correction"
-            elif rv < p["rsi_sideway_low"]:
-                state = "idle"
+                state = _CORRECTION
+            elif rv < sideway_low:
+                state = _IDLE
 
-        elif state == "correction":
+        elif state == _CORRECTION:
             crosses_ema = rv > ev and rv_prev <= ev_prev
             above_wma = rv > wv
             if crosses_ema and above_wma:
                 pos_arr[i] = 1
-                state = "hold"
-            elif rv < p["rsi_sideway_low"]:
-                state = "idle"
+                state = _HOLD
+            elif rv < sideway_low:
+                state = _IDLE
 
-        elif state == "hold":
+        elif state == _HOLD:
             pos_arr[i] = 1
-            if rv < p["rsi_sideway_low"]:
+            if rv < sideway_low:
                 pos_arr[i] = 0
-                state = "idle"
+                state = _IDLE
             elif dv == -1 and rv < ev:
                 pos_arr[i] = 0
-                state = "momentum"
-            elif rv >= p["rsi_momentum_long"]:
-                state = "momentum"
-
-    return pd.Series(pos_arr, index=rsi.index, dtype=int)
-
-
-def _short_signals(
-    rsi: pd.Series,
-    rsi_ema: pd.Series,
-    rsi_wma: pd.Series,
-    div: pd.Series,
-    p: dict,
-) -> pd.Series:
-    """State machine for SHORT signals in a downtrend (mirror of _long_signals)."""
-    n = len(rsi)
+                state = _MOMENTUM
+            elif rv >= momentum_long:
+                state = _MOMENTUM
+
+    return pos_arr
+
+
+@njit(cache=True)
+def _short_sm(
+    rsi_arr: np.ndarray,
+    ema_arr: np.ndarray,
+    wma_arr: np.ndarray,
+    div_arr: np.ndarray,
+    momentum_short: float,
+    sideway_high: float,
+) -> np.ndarray:
+    """Bar loop behind _short_signals (mirror of _long_sm)."""
+    n = len(rsi_arr)
     pos_arr = np.zeros(n, dtype=np.int8)
-    state = "idle"
-
-    rsi_arr = rsi.to_numpy()
-    ema_arr = rsi_ema.to_numpy()
-    wma_arr = rsi_wma.to_numpy()
-    div_arr = div.to_numpy()
+    state = _IDLE
 
     for i in range(1, n):
         rv = rsi_arr[i]
@@ -196,39 +250,99 @@ def _short_signals(
         ev_prev = ema_arr[i - 1]
         dv = div_arr[i]
 
-        if state == "idle":
-            if rv <= p["rsi_momentum_short"]:
-                state = "momentum"
+        if state == _IDLE:
+            if rv <= momentum_short:
+                state = _MOMENTUM
 
-        elif state == "momentum":
-            if rv <= p["rsi_momentum_short"]:
+        elif state == _MOMENTUM:
+            if rv <= momentum_short:
                 pass
             elif rv > ev and rv > wv:
-                state = "correction"
-            elif rv > p["rsi_sideway_high"]:
-                state = "idle"
+                state = _CORRECTION
+            elif rv > sideway_high:
+                state = _IDLE
 
-        elif state == "correction":
+        elif state == _CORRECTION:
             crosses_ema = rv < ev and rv_prev >= ev_prev
             below_wma = rv < wv
             if crosses_ema and below_wma:
                 pos_arr[i] = -1
-                state = "hold"
-            elif rv > p["rsi_sideway_high"]:
-                state = "idle"
+                state = _HOLD
+            elif rv > sideway_high:
+                state = _IDLE
 
-        elif state == "hold":
+        elif state == _HOLD:
             pos_arr[i] = -1
-            if rv > p["rsi_sideway_high"]:
+            if rv > sideway_high:
                 pos_arr[i] = 0
-                state = "idle"
+                state = _IDLE
             elif dv == 1 and rv > ev:
                 pos_arr[i] = 0
-                state = "momentum"
-            elif rv <= p["rsi_momentum_short"]:
-                state = "momentum"
+                state = _MOMENTUM
+            elif rv <= momentum_short:
+                state = _MOMENTUM
+
+    return pos_arr
+
+
+def _long_signals(
+    rsi: pd.Series,
+    rsi_ema: pd.Series,
+    rsi_wma: pd.Series,
+    div: pd.Series,
+    p: dict,
+) -> pd.Series:
+    """State machine for LONG signals in an uptrend.
 
-    return pd.Series(pos_arr, index=rsi.index, dtype=int)
+    States: idle → momentum → correction → ENTRY(+1) → hold → idle
+    """
+    pos_arr = _long_sm(
+        rsi.to_numpy(dtype=np.float64),
+        rsi_ema.to_numpy(dtype=np.float64),
+        rsi_wma.to_numpy(dtype=np.float64),
+        div.to_numpy(dtype=np.int8),
+        float(p["rsi_momentum_long"]),
+        float(p["rsi_sideway_low"]),
+    )
+    return pd.Series(pos_arr, index=rsi.index)
+
+
+def _short_signals(
+    rsi: pd.Series,
+    rsi_ema: pd.Series,
+    rsi_wma: pd.Series,
+    div: pd.Series,
+    p: dict,
+) -> pd.Series:
+    """State machine for SHORT signals in a downtrend (mirror of _long_signals)."""
+    pos_arr = _short_sm(
+        rsi.to_numpy(dtype=np.float64),
+        rsi_ema.to_numpy(dtype=np.float64),
+        rsi_wma.to_numpy(dtype=np.float64),
+        div.to_numpy(dtype=np.int8),
+        float(p["rsi_momentum_short"]),
+        float(p["rsi_sideway_high"]),
+    )
+    return pd.Series(pos_arr, index=rsi.index)
+
+
+@njit(cache=True, parallel=True)
+def _sm_grid(
+    rsi: np.ndarray,
+    ema: np.ndarray,
+    wma: np.ndarray,
+    div: np.ndarray,
+    momentum_long: np.ndarray,
+    sideway_low: np.ndarray,
+    momentum_short: np.ndarray,
+    sideway_high: np.ndarray,
+) -> np.ndarray:
+    """Combined long+short positions for K param sets; inputs are (K, N) rows."""
+    out = np.empty(rsi.shape, dtype=np.int8)
+    for k in prange(rsi.shape[0]):
+        out[k] = _long_sm(rsi[k], ema[k], wma[k], div[k], momentum_long[k], sideway_low[k])
+        out[k] += _short_sm(rsi[k], ema[k], wma[k], div[k], momentum_short[k], sideway_high[k])
+    return out
 
 
 # ---------------------------------------------------------------------------
@@ -236,6 +350,26 @@ def _short_signals(
 # ---------------------------------------------------------------------------
 
 
+# Indicator memo keyed on the close series' content and the indicator periods;
+# threshold-only sweeps reuse one indicator pass.
+_INPUT_MEMO = ContentMemo(maxsize=32)
+
+
+def _rsi_inputs(df: pd.DataFrame, p: dict) -> tuple[pd.Series, ...]:
+    """(rsi, rsi_ema, rsi_wma, div) for df's closes, memoized on their content."""
+    close = df["close"]
+    periods = (p["rsi_period"], p["ema_period"], p["wma_period"], p["div_lookback"])
+
+    def compute() -> tuple[pd.Series, ...]:
+        rsi = _calc_rsi(close, p["rsi_period"])
+        rsi_ema = _calc_ema(rsi, p["ema_period"])
+        rsi_wma = _calc_wma(rsi, p["wma_period"])
+        div = _detect_divergence(close, rsi, p["div_lookback"])
+        return (rsi, rsi_ema, rsi_wma, div)
+
+    return _INPUT_MEMO.get_or_compute((fingerprint(close.index, close), periods), compute)
+
+
 def _rsi_inertia_signals(
     df: pd.DataFrame,
     facts: dict | None,
@@ -243,20 +377,23 @@ def _rsi_inertia_signals(
     p: dict,
 ) -> pd.Series:
     """Bidirectional RSI state-machine signals - generates both LONG and SHORT."""
-    close = df["close"]
-
-    rsi = _calc_rsi(close, p["rsi_period"])
-    rsi_ema = _calc_ema(rsi, p["ema_period"])
-    rsi_wma = _calc_wma(rsi, p["wma_period"])
-    div = _detect_divergence(close, rsi, p["div_lookback"])
+    rsi, rsi_ema, rsi_wma, div = _rsi_inputs(df, p)
 
     # Generate both long and short signals independently
     long_signals = _long_signals(rsi, rsi_ema, rsi_wma, div, p)
     short_signals = _short_signals(rsi, rsi_ema, rsi_wma, div, p)
     
-    # Combine: short signals override long signals (short = -1 takes priority)
-    combined = long_signals.astype(int) + short_signals.astype(int)
-    return combined.astype(int)
+    # Combine by summing: a bar where both legs fire nets to 0 (flat), neither
+    # side wins. Both legs are int8 in {0, 1} / {-1, 0}, so the sum stays in int8.
+    return long_signals + short_signals
+
+
+def _shift1_zero(signals: pd.Series) -> pd.Series:
+    """``signals.shift(1).fillna(0).astype(int)`` as one copy into a fresh array."""
+    arr = signals.to_numpy()
+    out = np.zeros(arr.size, dtype=int)
+    out[1:] = arr[:-1]
+    return pd.Series(out, index=signals.index)
 
 
 # ---------------------------------------------------------------------------
@@ -300,7 +437,106 @@ def generate_signals(
     signals = _rsi_inertia_signals(df, facts, interval, p)
 
     # Shift 1 bar to avoid lookahead
-    return signals.shift(1).fillna(0).astype(int)
+    return _shift1_zero(signals)
+
+
+def generate_signals_grid(
+    df: pd.DataFrame,
+    param_grid: list[dict],
+    facts: dict | None = None,
+    interval: str = "1h",
+) -> pd.DataFrame:
+    """generate_signals for every param dict in param_grid, in one call.
+
+    Indicators are computed once per distinct period set and the state
+    machines run column-parallel under Numba.
+
+    Returns:
+        DataFrame aligned to df.index with one int column per combo (same
+        values as generate_signals), columns keyed by the swept params.
+    """
+    combos = [{**DEFAULT_PARAMS, **p} for p in param_grid]
+    swept = sorted({key for p in param_grid for key in p})
+    if swept:
+        columns = pd.MultiIndex.from_tuples(
+            [tuple(p[key] for key in swept) for p in combos], names=swept
+        )
+    else:
+        columns = pd.RangeIndex(len(combos))
+    if not combos:
+        return pd.DataFrame(index=df.index, columns=columns, dtype=int)
+
+    inputs = [_rsi_inputs(df, p) for p in combos]
+    rsi, ema, wma = (
+        np.stack([ind[j].to_numpy(dtype=np.float64) for ind in inputs]) for j in range(3)
+    )
+    div = np.stack([ind[3].to_numpy(dtype=np.int8) for ind in inputs])
+
+    def thresholds(key: str) -> np.ndarray:
+        return np.array([float(p[key]) for p in combos])
+
+    pos = _sm_grid(
+        rsi,
+        ema,
+        wma,
+        div,
+        thresholds("rsi_momentum_long"),
+        thresholds("rsi_sideway_low"),
+        thresholds("rsi_momentum_short"),
+        thresholds("rsi_sideway_high"),
+    )
+
+    # Shift 1 bar to avoid lookahead (same as _shift1_zero, per column)
+    out = np.zeros((df.shape[0], len(combos)), dtype=int)
+    out[1:] = pos.T[:-1]
+    return pd.DataFrame(out, index=df.index, columns=columns)
+
+
+@njit(cache=True)
+def _backtest_metrics(
+    close: np.ndarray, pos: np.ndarray, fee_rate: float
+) -> tuple[float, float, float, float]:
+    """Fused equity pass: (total_return, max_dd, mean, std) of net bar returns.
+
+    Same arithmetic as the pandas path in run_vectorized_backtest; the
+    variance is two-pass (ddof=1) like pandas' std.
+    """
+    n = close.shape[0]
+    net = np.empty(n)
+    net[0] = 0.0  # no return and no position change on the first bar
+    cum = 1.0
+    peak = 1.0
+    max_dd = 0.0
+    total = 0.0
+    for i in range(1, n):
+        r = close[i] / close[i - 1] - 1
+        net[i] = pos[i] * r - abs(pos[i] - pos[i - 1]) * fee_rate
+        total += net[i]
+        cum *= 1 + net[i]
+        peak = max(peak, cum)
+        max_dd = min(max_dd, (cum - peak) / peak)
+    mean = total / n
+    std = np.nan
+    if n > 1:
+        sq = 0.0
+        for i in range(n):
+            sq += (net[i] - mean) ** 2
+        std = np.sqrt(sq / (n - 1))
+    return cum - 1, max_dd, mean, std
+
+
+def _backtest_metrics_np(
+    close: np.ndarray, pos: np.ndarray, fee_rate: float
+) -> tuple[float, float, float, float]:
+    """NumPy twin of _backtest_metrics for installs without Numba."""
+    n = close.shape[0]
+    net = np.zeros(n)
+    net[1:] = pos[1:] * (close[1:] / close[:-1] - 1) - np.abs(np.diff(pos)) * fee_rate
+    cum = np.cumprod(1 + net)
+    peak = np.maximum.accumulate(cum)  # starts at 1.0, so never zero
+    max_dd = float(((cum - peak) / peak).min())
+    std = float(net.std(ddof=1)) if n > 1 else np.nan
+    return float(cum[-1] - 1), max_dd, float(net.mean()), std
 
 
 def run_vectorized_backtest(
@@ -310,61 +546,81 @@ def run_vectorized_backtest(
 ) -> dict:
     """Run vectorized backtest. Returns metrics dict + trade_log."""
     fee_rate = fee_bps / 10_000
-    returns = df["close"].pct_change().fillna(0)
     pos = signals
-
-    strategy_returns = pos * returns
-    pos_change = pos.diff().abs().fillna(0)
-    fees = pos_change * fee_rate
-    net_returns = strategy_returns - fees
-
-    cumulative = (1 + net_returns).cumprod()
-    total_return = float(cumulative.iloc[-1] - 1) * 100
-
-    roll_max = cumulative.cummax()
-    # Guard against division by zero if roll_max contains zeros
-    drawdown = pd.Series(0.0, index=roll_max.index)
-    non_zero_mask = roll_max > 0
-    drawdown[non_zero_mask] = (cumulative[non_zero_mask] - roll_max[non_zero_mask]) / roll_max[non_zero_mask]
-    max_dd = float(drawdown.min()) * 100
+    close_arr = df["close"].to_numpy(dtype=np.float64)
+    fused = len(df) > 0 and pos.index.equals(df.index)
+    if fused:
+        pos_f = pos.to_numpy(dtype=np.float64)
+        # Gaps and zero closes keep pandas' NaN/inf handling
+        fused = bool(np.isfinite(pos_f).all() and (np.isfinite(close_arr) & (close_arr != 0)).all())
+
+    if fused:
+        metrics_fn = _backtest_metrics if HAS_NUMBA else _backtest_metrics_np
+        total, dd, mean, std = metrics_fn(close_arr, pos_f, fee_rate)
+        total_return = total * 100
+        max_dd = dd * 100
+    else:
+        returns = df["close"].pct_change().fillna(0)
+        strategy_returns = pos * returns
+        # |Δpos| straight on the array; a NaN step (first bar, gaps) costs no fee
+        pos_arr = pos.to_numpy(dtype=np.float64)
+        pos_change = np.zeros(pos_arr.size)
+        np.abs(np.diff(pos_arr), out=pos_change[1:])
+        pos_change[np.isnan(pos_change)] = 0.0
+        fees = pd.Series(pos_change * fee_rate, index=pos.index)
+        net_returns = strategy_returns - fees
+
+        cumulative = (1 + net_returns).cumprod()
+        total_return = float(cumulative.iloc[-1] - 1) * 100
+
+        roll_max = cumulative.cummax()
+        # Guard against division by zero if roll_max contains zeros
+        drawdown = pd.Series(0.0, index=roll_max.index)
+        non_zero_mask = roll_max > 0
+        drawdown[non_zero_mask] = (cumulative[non_zero_mask] - roll_max[non_zero_mask]) / roll_max[non_zero_mask]
+        max_dd = float(drawdown.min()) * 100
+        mean, std = net_returns.mean(), net_returns.std()
 
     sharpe = 0.0
-    if net_returns.std() > 0:
+    if std > 0:
         ann_factor = (365 * 24) ** 0.5
-        sharpe = float(net_returns.mean() / net_returns.std() * ann_factor)
+        sharpe = float(mean / std * ann_factor)
 
-    # Build trade log
+    # Build trade log: walk only the bars where the position changes
     trade_log: list[dict] = []
     current_trade: dict | None = None
-    df_reset = df.reset_index()
-
-    for i in range(1, len(df_reset)):
-        prev_pos = pos.iloc[i - 1]
-        curr_pos = pos.iloc[i]
-
-        if curr_pos != prev_pos:
-            if current_trade is not None:
-                exit_price = float(df_reset["close"].iloc[i])
-                entry_price = current_trade["entry_price"]
-                side_mult = 1 if current_trade["side"] == "long" else -1
-                # Guard against division by zero if entry_price is 0
-                raw_pnl = ((exit_price - entry_price) / entry_price * side_mult) if entry_price != 0 else 0.0
-                net_pnl = raw_pnl - (fee_rate * 2)
-                current_trade["exit"] = df_reset["open_time"].iloc[i].isoformat()
-                current_trade["exit_price"] = exit_price
-                current_trade["pnl_pct"] = round(net_pnl * 100, 4)
-                current_trade["bars"] = i - current_trade.pop("_entry_idx")
-                trade_log.append(current_trade)
-                current_trade = None
-
-            if curr_pos != 0:
-                current_trade = {
-                    "entry": df_reset["open_time"].iloc[i].isoformat(),
-                    "side": "long" if curr_pos == 1 else "short",
-                    "entry_price": float(df_reset["close"].iloc[i]),
-                    "reason": "Signal Flip",
-                    "_entry_idx": i,
-                }
+    pos_arr = pos.to_numpy()
+    change_idx = np.flatnonzero(pos_arr[1:] != pos_arr[:-1]) + 1
+    # open_time is the index (read_candles) or a column; no reset_index() copy
+    stamps: list[str] = []
+    if change_idx.size:
+        times = df.index if df.index.name == "open_time" else df["open_time"]
+        stamps = [ts.isoformat() for ts in times.take(change_idx)]
+
+    for i, stamp in zip(change_idx.tolist(), stamps, strict=True):
+        curr_pos = pos_arr[i]
+        if current_trade is not None:
+            exit_price = float(close_arr[i])
+            entry_price = current_trade["entry_price"]
+            side_mult = 1 if current_trade["side"] == "long" else -1
+            # Guard against division by zero if entry_price is 0
+            raw_pnl = ((exit_price - entry_price) / entry_price * side_mult) if entry_price != 0 else 0.0
+            net_pnl = raw_pnl - (fee_rate * 2)
+            current_trade["exit"] = stamp
+            current_trade["exit_price"] = exit_price
+            current_trade["pnl_pct"] = round(net_pnl * 100, 4)
+            current_trade["bars"] = i - current_trade.pop("_entry_idx")
+            trade_log.append(current_trade)
+            current_trade = None
+
+        if curr_pos != 0:
+            current_trade = {
+                "entry": stamp,
+                "side": "long" if curr_pos == 1 else "short",
+                "entry_price": float(close_arr[i]),
+                "reason": "Signal Flip",
+                "_entry_idx": i,
+            }
 
     metrics = {
         "total_return_pct": round(total_return, 4),
@@ -375,3 +631,62 @@ def run_vectorized_backtest(
     }
 
     return {"metrics": metrics, "trade_log": trade_log}
+
+
+# ---------------------------------------------------------------------------
+# Parameter sweeps
+# ---------------------------------------------------------------------------
+
+# Per-worker copy of the sweep inputs, set once by _init_batch_worker
+_BATCH_INPUTS: tuple[pd.DataFrame, dict | None, str] | None = None
+
+
+def _init_batch_worker(df: pd.DataFrame, facts: dict | None, interval: str) -> None:
+    global _BATCH_INPUTS
+    _BATCH_INPUTS = (df, facts, interval)
+
+
+def _one_backtest(df: pd.DataFrame, facts: dict | None, interval: str, params: dict) -> dict:
+    p = dict(params)
+    fee_bps = p.pop("fee_bps", 2.0)
+    signals = generate_signals(df, facts, interval=interval, params=p)
+    return run_vectorized_backtest(df, signals, fee_bps=fee_bps)
+
+
+def _pooled_backtest(params: dict) -> dict:
+    """Worker-side _one_backtest on the inputs shipped by _init_batch_worker."""
+    return _one_backtest(*_BATCH_INPUTS, params)
+
+
+def run_batch(
+    df: pd.DataFrame,
+    facts: dict | None,
+    param_grid: list[dict],
+    interval: str = "1h",
+    max_workers: int | None = 1,
+) -> list[dict]:
+    """Backtest every param dict in param_grid.
+
+    Each dict holds generate_signals overrides plus an optional ``fee_bps``.
+
+    Args:
+        max_workers: 1 (default) runs in-process, which is fastest for typical
+                     grids: each backtest takes milliseconds and shares the
+                     indicator memo. Larger values (None = CPU count) fan out
+                     over spawned worker processes, shipping df/facts once per
+                     worker; worth it only for big grids on long histories.
+
+    Returns:
+        run_vectorized_backtest results, in param_grid order.
+    """
+    if max_workers == 1 or len(param_grid) <= 1:
+        return [_one_backtest(df, facts, interval, p) for p in param_grid]
+    # spawn, not fork: forking after Numba's parallel kernels have started its
+    # thread pool can deadlock the workers or the parent at exit
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_batch_worker,
+        initargs=(df, facts, interval),
+    ) as pool:
+        return list(pool.map(_pooled_backtest, param_grid))
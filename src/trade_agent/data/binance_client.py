@@ -7,22 +7,39 @@ No API key required (public endpoints only).
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 log = logging.getLogger(__name__)
 
 _BASE = "https://fapi.binance.com"
 _KLINES_ENDPOINT = "/fapi/v1/klines"
 _MAX_LIMIT = 1500  # Binance max per request (weight scales with limit)
-_RETRY_DELAYS = [1, 3, 10]  # seconds between retries
+_MAX_REQUESTS_PER_S = 4.0  # limit=1500 costs weight 10; 2400 weight/min ≈ 4 req/s
+_MAX_RETRIES = 3  # urllib3 2.x backoff before each retry: 0s, 2s, 4s (Retry-After wins)
 
 # Supported intervals for research (15m and above)
 SUPPORTED_INTERVALS = ["15m", "1h", "4h", "1d", "1w", "1M"]
 
+# Interval unit suffix → ms; "M" is a 30-day month (shorter than any real one)
+_INTERVAL_UNIT_MS = {
+    "m": 60_000,
+    "h": 60 * 60_000,
+    "d": 24 * 60 * 60_000,
+    "w": 7 * 24 * 60 * 60_000,
+    "M": 30 * 24 * 60 * 60_000,
+}
+
 
 def _ts_ms(dt: datetime) -> int:
     """Convert UTC datetime → milliseconds epoch."""
@@ -50,14 +67,125 @@ def _parse_kline(raw: list) -> dict:
     }
 
 
+def _interval_ms(interval: str) -> int:
+    """Bar length of a Binance interval string ('1m', '30m', '2h', '1M', ...) in ms."""
+    unit_ms = _INTERVAL_UNIT_MS.get(interval[-1:])
+    count = interval[:-1]
+    if unit_ms is None or not count.isdigit() or int(count) == 0:
+        raise ValueError(f"Unsupported kline interval: {interval!r}")
+    return int(count) * unit_ms
+
+
+def _range_windows(start_ms: int, end_ms: int, span_ms: int) -> list[tuple[int, int]]:
+    """Split [start_ms, end_ms] into disjoint inclusive windows of span_ms."""
+    return [(t, min(t + span_ms - 1, end_ms)) for t in range(start_ms, end_ms + 1, span_ms)]
+
+
+def _klines_params(
+    symbol: str, interval: str, start_ms: int, end_ms: int | None, limit: int
+) -> dict:
+    """Query params for /fapi/v1/klines."""
+    params: dict = {
+        "symbol": symbol.upper(),
+        "interval": interval,
+        "startTime": start_ms,
+        "limit": min(limit, _MAX_LIMIT),
+    }
+    if end_ms is not None:
+        params["endTime"] = end_ms
+    return params
+
+
+# (column, position in the raw kline row, dtype): the fields _parse_kline keeps
+_KLINE_FIELDS = (
+    ("open_time", 0, np.int64),
+    ("open", 1, np.float64),
+    ("high", 2, np.float64),
+    ("low", 3, np.float64),
+    ("close", 4, np.float64),
+    ("volume", 5, np.float64),
+    ("close_time", 6, np.int64),
+    ("quote_volume", 7, np.float64),
+    ("trades", 8, np.int64),
+    ("taker_buy_base", 9, np.float64),
+    ("taker_buy_quote", 10, np.float64),
+)
+
+
+def _klines_frame(raw: list[list]) -> pd.DataFrame:
+    """Columnar twin of ``[_parse_kline(k) for k in raw]``: one array per field."""
+    cols = list(zip(*raw, strict=True)) if raw else [()] * len(_KLINE_FIELDS)
+    return pd.DataFrame(
+        {name: np.asarray(cols[pos], dtype=dtype) for name, pos, dtype in _KLINE_FIELDS}
+    )
+
+
+# Arrow types for _KLINE_FIELDS; the ms epoch columns become UTC timestamps as in KlinesStore
+_KLINES_ARROW_SCHEMA = pa.schema(
+    [
+        (name, pa.timestamp("ms", tz="UTC") if pos in (0, 6) else pa.from_numpy_dtype(dtype))
+        for name, pos, dtype in _KLINE_FIELDS
+    ]
+)
+
+
+def _klines_batch(raw: list[list]) -> pa.RecordBatch:
+    """Arrow twin of ``_klines_frame``: one typed column per field, no pandas step."""
+    cols = list(zip(*raw, strict=True)) if raw else [()] * len(_KLINE_FIELDS)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array(np.asarray(cols[pos], dtype=dtype), type=field.type)
+            for (_, pos, dtype), field in zip(_KLINE_FIELDS, _KLINES_ARROW_SCHEMA, strict=True)
+        ],
+        schema=_KLINES_ARROW_SCHEMA,
+    )
+
+
+class _RateLimiter:
+    """Token bucket shared by concurrent fetch workers (thread-safe)."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self._rate = rate
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one request token is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            wait = (1.0 - self._tokens) / self._rate if self._tokens < 1.0 else 0.0
+            # Reserve the token now; sleeping under the lock keeps workers in line
+            self._tokens -= 1.0
+            if wait:
+                time.sleep(wait)
+                self._last = time.monotonic()
+                self._tokens = 0.0
+
+
 class BinanceClient:
     """Thin wrapper around Binance USD-M Futures public klines API."""
 
     def __init__(self, base_url: str = _BASE, timeout: int = 30) -> None:
         self._base = base_url.rstrip("/")
+        self._klines_url = f"{self._base}{_KLINES_ENDPOINT}"
         self._timeout = timeout
         self._session = requests.Session()
         self._session.headers.update({"User-Agent": "trade-agent/0.2"})
+        # Keep-alive pool + urllib3-level retry: pagination reuses one TLS connection
+        retry = Retry(
+            total=_MAX_RETRIES,
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def get_klines(
         self,
@@ -71,38 +199,54 @@ class BinanceClient:
 
         Returns list of typed dicts. Raises on non-retriable HTTP errors.
         """
-        params: dict = {
-            "symbol": symbol.upper(),
-            "interval": interval,
-            "startTime": start_ms,
-            "limit": min(limit, _MAX_LIMIT),
-        }
-        if end_ms is not None:
-            params["endTime"] = end_ms
-
-        last_exc: Exception | None = None
-        for attempt, delay in enumerate([0] + _RETRY_DELAYS, start=1):
-            if delay:
-                log.debug("Retry %d/%d — sleeping %ds", attempt, len(_RETRY_DELAYS) + 1, delay)
-                time.sleep(delay)
-            try:
-                resp = self._session.get(
-                    f"{self._base}{_KLINES_ENDPOINT}",
-                    params=params,
-                    timeout=self._timeout,
-                )
-                if resp.status_code == 429:
-                    retry_after = int(resp.headers.get("Retry-After", delay or 10))
-                    log.warning("Rate-limited — sleeping %ds", retry_after)
-                    time.sleep(retry_after)
-                    continue
-                resp.raise_for_status()
-                return [_parse_kline(k) for k in resp.json()]
-            except requests.RequestException as exc:
-                log.warning("Request failed (attempt %d): %s", attempt, exc)
-                last_exc = exc
-
-        raise RuntimeError(f"All retries exhausted for {symbol} {interval}") from last_exc
+        raw = self._fetch_klines(_klines_params(symbol, interval, start_ms, end_ms, limit))
+        return [_parse_kline(k) for k in raw]
+
+    def _fetch_klines(self, params: dict) -> list[list]:
+        """GET one page of raw kline rows; retries happen in the session adapter."""
+        try:
+            resp = self._session.get(self._klines_url, params=params, timeout=self._timeout)
+            resp.raise_for_status()
+            return resp.json()
+        except requests.RequestException as exc:
+            log.warning("Request failed: %s", exc)
+            raise RuntimeError(
+                f"Klines request failed for {params['symbol']} {params['interval']}"
+            ) from exc
+
+    def get_klines_range_concurrent(
+        self,
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int,
+        max_workers: int = 8,
+        max_requests_per_s: float = _MAX_REQUESTS_PER_S,
+    ) -> list[dict]:
+        """Fetch [start_ms, end_ms] as parallel fixed-size windows.
+
+        The range is split into non-overlapping windows of at most `_MAX_LIMIT`
+        klines each, fetched on a thread pool behind a shared token-bucket rate
+        limiter. Returns klines sorted ascending by open_time, deduplicated.
+
+        Raises:
+            ValueError: if `interval` is not a Binance interval string.
+        """
+        windows = _range_windows(start_ms, end_ms, _MAX_LIMIT * _interval_ms(interval))
+        limiter = _RateLimiter(max_requests_per_s, burst=max_workers)
+
+        def fetch(window: tuple[int, int]) -> list[list]:
+            limiter.acquire()
+            return self._fetch_klines(
+                _klines_params(symbol, interval, window[0], window[1], _MAX_LIMIT)
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            pages = list(pool.map(fetch, windows))
+
+        # Windows are disjoint, but guard against boundary overlaps anyway
+        by_open: dict[int, list] = {k[0]: k for page in pages for k in page}
+        return [_parse_kline(by_open[t]) for t in sorted(by_open)]
 
     def get_klines_paginated(
         self,
@@ -117,13 +261,55 @@ class BinanceClient:
         Each yielded batch is sorted ascending by open_time.
         Stops when the last returned open_time reaches end_ms or no new data.
         """
+        for raw in self._raw_pages(symbol, interval, start_ms, end_ms, limit):
+            yield [_parse_kline(k) for k in raw]
+
+    def get_klines_frames(
+        self,
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int,
+        limit: int = _MAX_LIMIT,
+    ) -> Iterator[pd.DataFrame]:
+        """Like get_klines_paginated, but each batch is one typed DataFrame.
+
+        Same columns and values as ``pd.DataFrame(batch)`` of the dict batches,
+        built column-wise without a dict per kline.
+        """
+        for raw in self._raw_pages(symbol, interval, start_ms, end_ms, limit):
+            yield _klines_frame(raw)
+
+    def get_klines_paginated_arrow(
+        self,
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int,
+        limit: int = _MAX_LIMIT,
+    ) -> Iterator[pa.RecordBatch]:
+        """Like get_klines_paginated, but each batch is one pyarrow RecordBatch.
+
+        open_time/close_time are UTC ms timestamps, so batches can go straight to
+        a ``pq.ParquetWriter`` without materializing dicts or a DataFrame.
+        """
+        for raw in self._raw_pages(symbol, interval, start_ms, end_ms, limit):
+            yield _klines_batch(raw)
+
+    def _raw_pages(
+        self, symbol: str, interval: str, start_ms: int, end_ms: int, limit: int
+    ) -> Iterator[list[list]]:
+        """Pagination shared by the dict, frame and arrow iterators (raw rows)."""
+        # One params dict for the whole pull; only startTime moves between pages
+        params = _klines_params(symbol, interval, start_ms, end_ms, limit)
         cursor = start_ms
         while cursor < end_ms:
-            batch = self.get_klines(symbol, interval, cursor, end_ms, limit)
-            if not batch:
+            params["startTime"] = cursor
+            raw = self._fetch_klines(params)
+            if not raw:
                 break
-            last_open = batch[-1]["open_time"]
+            last_open = raw[-1][0]
             if last_open < cursor:
                 break  # no progress guard — stop before yielding stale data
-            yield batch
+            yield raw
             cursor = last_open + 1
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 
+import numpy as np
+
 from ..types import BrokerLike, Candle, OrderSide, RiskLike, Signal, StrategyLike
 from .metrics import classify_trades, compute_max_drawdown
 
@@ -40,6 +43,27 @@ class BacktestEngine:
         self.risk = risk
         self._has_run = False
 
+    def _signals(self) -> Iterator[Signal]:
+        """Yield one Signal per candle, in order.
+
+        Strategies with ``precompute`` (BatchStrategyLike) produce the whole
+        series in one pass; otherwise generate() sees the growing history.
+        """
+        precompute = getattr(self.strategy, "precompute", None)
+        if precompute is not None:
+            signals = precompute(self.candles)
+            if len(signals) != len(self.candles):
+                raise ValueError(
+                    f"precompute() returned {len(signals)} signals for {len(self.candles)} candles"
+                )
+            yield from signals
+            return
+
+        history: list[Candle] = []
+        for candle in self.candles:
+            history.append(candle)
+            yield self.strategy.generate(history)
+
     def run(self) -> BacktestResult:
         # Guard: broker state is mutated; running twice produces garbage results.
         if self._has_run:
@@ -49,46 +73,49 @@ class BacktestEngine:
             )
         self._has_run = True
 
-        history: list[Candle] = []
-        equity_curve: list[float] = []
+        equity_curve = np.empty(len(self.candles), dtype=np.float64)
+        # Fees accumulate as orders fill, in fill order (same sum as over broker.trades)
+        total_fees = 0.0
 
-        for candle in self.candles:
-            history.append(candle)
-            signal = self.strategy.generate(history)
+        for i, (candle, signal) in enumerate(zip(self.candles, self._signals(), strict=True)):
             qty = self.risk.size(signal, self.broker, candle.close)
 
+            trade = None
             if signal == Signal.BUY and qty > 0:
-                self.broker.execute_market_order(
+                trade = self.broker.execute_market_order(
                     side=OrderSide.BUY,
                     qty=qty,
                     price=candle.close,
                     ts=candle.ts,
                 )
             elif signal == Signal.SELL and qty > 0:
-                self.broker.execute_market_order(
+                trade = self.broker.execute_market_order(
                     side=OrderSide.SELL,
                     qty=qty,
                     price=candle.close,
                     ts=candle.ts,
                 )
+            if trade is not None:
+                total_fees += trade.fee
 
             # Mark-to-market equity after each candle (for drawdown)
-            equity_curve.append(self.broker.equity(candle.close))
+            equity_curve[i] = self.broker.equity(candle.close)
 
         # Force close position at final candle for a realized result
         last_price = self.candles[-1].close
         if self.broker.position_qty > 0:
-            self.broker.execute_market_order(
+            trade = self.broker.execute_market_order(
                 side=OrderSide.SELL,
                 qty=self.broker.position_qty,
                 price=last_price,
                 ts=self.candles[-1].ts,
             )
+            if trade is not None:
+                total_fees += trade.fee
             equity_curve[-1] = self.broker.equity(last_price)
 
         final_equity = self.broker.equity(last_price)
         total_return_pct = (final_equity / self.broker.initial_cash - 1) * 100
-        total_fees = sum(t.fee for t in self.broker.trades)
         wins, losses = classify_trades(self.broker.trades)
         max_drawdown_pct = compute_max_drawdown(equity_curve)
 
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
+import numpy as np
+
 from ..types import OrderSide, Trade
 
 
@@ -13,44 +17,43 @@ def classify_trades(trades: list[Trade]) -> tuple[int, int]:
     PnL per unit = net_sell_price_per_unit - avg_buy_cost_per_unit
                  = (sell_price - sell_fee/sell_qty) - (buy_notional / buy_qty)
     """
-    wins = 0
-    losses = 0
-
-    buy_notional = 0.0  # pure notional (no fees) of accumulated buys
-    buy_qty = 0.0
-
-    for t in trades:
-        if t.side == OrderSide.BUY:
-            buy_notional += t.notional  # do NOT add fee here
-            buy_qty += t.qty
-            continue
-
-        if t.side == OrderSide.SELL and buy_qty > 0:
-            avg_entry = buy_notional / buy_qty
-            # Subtract sell-side fee from effective sale price
-            net_sell_price = t.price - (t.fee / t.qty)
-            pnl_per_unit = net_sell_price - avg_entry
-            if pnl_per_unit > 0:
-                wins += 1
-            else:
-                losses += 1
-            buy_notional = 0.0
-            buy_qty = 0.0
-
+    n = len(trades)
+    if n == 0:
+        return 0, 0
+
+    is_buy = np.fromiter((t.side == OrderSide.BUY for t in trades), dtype=bool, count=n)
+    is_sell = np.fromiter((t.side == OrderSide.SELL for t in trades), dtype=bool, count=n)
+    qty = np.fromiter((t.qty for t in trades), dtype=np.float64, count=n)
+    price = np.fromiter((t.price for t in trades), dtype=np.float64, count=n)
+    fee = np.fromiter((t.fee for t in trades), dtype=np.float64, count=n)
+
+    # Round-trip k = buys after the k-th SELL and before the next one. bincount
+    # adds weights in trade order, so each segment sum matches a running total.
+    seg = np.cumsum(is_sell) - is_sell
+    n_seg = int(is_sell.sum()) + 1
+    buy_notional = np.bincount(seg[is_buy], weights=(qty * price)[is_buy], minlength=n_seg)
+    buy_qty = np.bincount(seg[is_buy], weights=qty[is_buy], minlength=n_seg)
+
+    # SELLs with no accumulated buys are not round-trips
+    closes = seg[is_sell]
+    valid = buy_qty[closes] > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avg_entry = buy_notional[closes] / buy_qty[closes]
+        # Subtract sell-side fee from effective sale price
+        net_sell_price = price[is_sell] - fee[is_sell] / qty[is_sell]
+    won = (net_sell_price - avg_entry) > 0
+
+    wins = int((valid & won).sum())
+    losses = int((valid & ~won).sum())
     return wins, losses
 
 
-def compute_max_drawdown(equity_curve: list[float]) -> float:
+def compute_max_drawdown(equity_curve: Sequence[float] | np.ndarray) -> float:
     """Return the maximum peak-to-trough drawdown as a positive percentage."""
-    if not equity_curve:
+    eq = np.asarray(equity_curve, dtype=np.float64)
+    if eq.size == 0:
         return 0.0
-    peak = equity_curve[0]
-    max_dd = 0.0
-    for eq in equity_curve:
-        if eq > peak:
-            peak = eq
-        if peak > 0:
-            dd = (peak - eq) / peak * 100
-            if dd > max_dd:
-                max_dd = dd
-    return max_dd
+    peak = np.maximum.accumulate(eq)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dd = np.where(peak > 0, (peak - eq) / peak * 100, 0.0)
+    return float(dd.max(initial=0.0))
@@ -120,6 +120,7 @@ def main() -> None:
         )
 
     # Build + persist ALL-timeframe payload
+    payload: dict | None = None
     if per_tf_facts:
         payload = build_payload(args.symbol, as_of, per_tf_facts)
         upsert_market_facts(
@@ -143,8 +144,7 @@ def main() -> None:
     for row in summary_rows:
         tbl.add_row(*row)
 
-    if per_tf_facts:
-        payload = build_payload(args.symbol, as_of, per_tf_facts)
+    if payload is not None:
         inv = payload.get("invalidation", {})
         tbl.caption = (
             f"Support below: {inv.get('bear_below')}  |  Resistance above: {inv.get('bull_above')}"
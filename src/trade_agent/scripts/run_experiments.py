@@ -18,7 +18,7 @@ from rich.console import Console
 from rich.logging import RichHandler
 from rich.table import Table
 
-from trade_agent.backtest.facts_strategy import generate_signals, run_vectorized_backtest
+from trade_agent.backtest.facts_strategy import run_batch
 from trade_agent.db import (
     connect,
     init_db,
@@ -59,6 +59,12 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--facts-version", default="v1")
     p.add_argument("--strategy", default="rsi_inertia")
     p.add_argument("--top", type=int, default=20, help="Show top N results (default: 20)")
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes; 1 runs in-process (default), 0 uses CPU count",
+    )
     p.add_argument("--save", action="store_true", help="Save all runs to backtest_runs")
     p.add_argument("--json", action="store_true", dest="json_mode")
     return p
@@ -95,21 +101,12 @@ def main() -> None:
     )
 
     results: list[dict] = []
+    batch = run_batch(df, facts, combos, interval=args.interval, max_workers=args.workers or None)
 
-    for combo in combos:
-        zm = combo.get("zone_mult", 1.5)
-        fb = combo.get("fee_bps", 2.0)
-
-        signals = generate_signals(
-            df,
-            facts,
-            interval=args.interval,
-            params={"zone_mult": zm},
-        )
-        result = run_vectorized_backtest(df, signals, fee_bps=fb)
+    for combo, result in zip(combos, batch, strict=True):
         metrics = result["metrics"]
-        metrics["zone_mult"] = zm
-        metrics["fee_bps"] = fb
+        metrics["zone_mult"] = combo.get("zone_mult", 1.5)
+        metrics["fee_bps"] = combo.get("fee_bps", 2.0)
         results.append(metrics)
 
         if args.save:
@@ -43,9 +43,12 @@ def _parse_dt(s: str) -> datetime:
     return datetime.fromisoformat(s).replace(tzinfo=timezone.utc)
 
 
-def _batch_to_df(symbol: str, interval: str, batch: list[dict]) -> pd.DataFrame:
-    """Convert a list of raw kline dicts to a typed DataFrame with symbol/interval columns."""
-    df = pd.DataFrame(batch)
+def _batch_to_df(symbol: str, interval: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Add symbol/interval columns and UTC timestamps to a get_klines_frames batch.
+
+    Converts ``df`` in place and returns it: each batch is a fresh frame owned
+    by the sync loop, so there is nothing to copy.
+    """
     df["symbol"] = symbol.upper()
     df["interval"] = interval
     df["open_time"] = pd.to_datetime(df["open_time"], unit="ms", utc=True)
@@ -97,7 +100,7 @@ def _sync_one(
 
     total_new = 0
     batches = 0
-    for batch in client.get_klines_paginated(symbol, interval, start_ms, end_ms):
+    for batch in client.get_klines_frames(symbol, interval, start_ms, end_ms):
         df = _batch_to_df(symbol, interval, batch)
         written = upsert_candles(con, df)
         total_new += written
@@ -13,6 +13,7 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import copy
 import logging
 from datetime import datetime, timedelta, timezone
 
@@ -61,27 +62,46 @@ def _parse_dt(s: str) -> datetime:
     return datetime.fromisoformat(s).replace(tzinfo=timezone.utc)
 
 
+def _tf_facts(symbol: str, tf: str, df: pd.DataFrame, memo: dict[tuple, dict] | None) -> dict:
+    """compute_trend + compute_sr for one slice, memoized across windows.
+
+    Overlapping windows often land on the same higher-TF slice (e.g. 1d bars
+    between steps); those reuse the facts in ``memo``, keyed on
+    (symbol, tf, first/last open_time, bars). Every call returns a deep copy,
+    so callers never hold a reference into the memo.
+    """
+    if memo is None:
+        return {"trend": compute_trend(df), "sr": compute_sr(df)}
+    key = (symbol, tf, df.index[0].value, df.index[-1].value, len(df))
+    hit = memo.get(key)
+    if hit is not None:
+        return copy.deepcopy(hit)
+    facts = memo[key] = {"trend": compute_trend(df), "sr": compute_sr(df)}
+    return copy.deepcopy(facts)
+
+
 def _analyze_window(
-    con,
+    history: dict[str, pd.DataFrame],
     symbol: str,
-    tfs: list[str],
     train_end: datetime,
     lookback: int,
+    memo: dict[tuple, dict] | None = None,
 ) -> dict:
-    """Run trend+SR analysis on train data up to train_end."""
+    """Run trend+SR analysis on train data up to train_end.
+
+    Args:
+        history: full candle history per TF, read once for all windows.
+        memo:    per-TF facts cache shared across one run's windows.
+    """
     per_tf: dict = {}
-    for tf in tfs:
-        df = read_candles(con, symbol, tf)
+    for tf, df in history.items():
         if df.empty:
             continue
         # Filter up to train_end and take last N bars
-        df = df[df.index <= train_end].iloc[-lookback:]
+        df = df.iloc[: df.index.searchsorted(train_end, side="right")].iloc[-lookback:]
         if len(df) < 20:
             continue
-        per_tf[tf] = {
-            "trend": compute_trend(df),
-            "sr": compute_sr(df),
-        }
+        per_tf[tf] = _tf_facts(symbol, tf, df, memo)
     if not per_tf:
         return {}
     return build_payload(symbol, train_end, per_tf)
@@ -124,10 +144,12 @@ def main() -> None:
     )
 
     results: list[dict] = []
+    history = {tf: read_candles(con, args.symbol, tf) for tf in tfs}
+    facts_memo: dict[tuple, dict] = {}  # lives for this run only
 
     for i, (tr_s, tr_e, te_s, te_e) in enumerate(windows, 1):
         # 1. Analyze on train data
-        facts = _analyze_window(con, args.symbol, tfs, tr_e, args.lookback)
+        facts = _analyze_window(history, args.symbol, tr_e, args.lookback, facts_memo)
         if not facts:
             results.append(
                 {
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from enum import StrEnum
@@ -49,6 +50,16 @@ class StrategyLike(Protocol):
     def generate(self, candles: list[Candle]) -> Signal: ...
 
 
+class BatchStrategyLike(StrategyLike, Protocol):
+    """A strategy that can also emit every bar's Signal in one pass.
+
+    ``precompute(candles)[i]`` must equal ``generate(candles[: i + 1])``.
+    BacktestEngine prefers it over calling generate() on the growing history.
+    """
+
+    def precompute(self, candles: list[Candle]) -> Sequence[Signal]: ...
+
+
 class BrokerLike(Protocol):
     """Minimal broker interface required by risk and backtest modules."""
 
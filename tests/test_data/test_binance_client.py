@@ -2,10 +2,27 @@
 
 from __future__ import annotations
 
+import io
+import json
 from datetime import UTC
 from unittest.mock import MagicMock, patch
 
-from trade_agent.data.binance_client import BinanceClient, _parse_kline, _ts_ms
+import pandas as pd
+import pyarrow as pa
+import pytest
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.response import HTTPResponse
+
+from trade_agent.data.binance_client import (
+    _MAX_LIMIT,
+    BinanceClient,
+    _interval_ms,
+    _klines_frame,
+    _parse_kline,
+    _range_windows,
+    _RateLimiter,
+    _ts_ms,
+)
 
 
 def _make_raw_kline(open_time_ms: int = 1_700_000_000_000) -> list:
@@ -39,6 +56,12 @@ def test_parse_kline_types():
     assert k["high"] == 30100.0
 
 
+def test_klines_frame_matches_dict_rows():
+    raw = [_make_raw_kline(1_700_000_000_000 + i * 60_000) for i in range(4)]
+    pd.testing.assert_frame_equal(_klines_frame(raw), pd.DataFrame([_parse_kline(k) for k in raw]))
+    assert list(_klines_frame([]).columns) == list(_parse_kline(raw[0]))
+
+
 def test_ts_ms_round_trip():
     from datetime import datetime
 
@@ -104,3 +127,177 @@ def test_get_klines_paginated_advances():
         batches = list(client.get_klines_paginated("BTCUSDT", "1m", ts, ts + 200_000))
 
     assert len(batches) == 2
+
+
+def test_get_klines_frames_matches_paginated():
+    ts = 1_700_000_000_000
+    pages = [
+        [_make_raw_kline(ts), _make_raw_kline(ts + 60_000)],
+        [_make_raw_kline(ts + 120_000)],
+        [],
+    ]
+    client = BinanceClient()
+
+    with patch.object(client._session, "get", side_effect=[_mock_response(p) for p in pages]):
+        dicts = list(client.get_klines_paginated("BTCUSDT", "1m", ts, ts + 300_000))
+    with patch.object(client._session, "get", side_effect=[_mock_response(p) for p in pages]):
+        frames = list(client.get_klines_frames("BTCUSDT", "1m", ts, ts + 300_000))
+
+    assert len(frames) == len(dicts) == 2
+    for frame, batch in zip(frames, dicts, strict=True):
+        pd.testing.assert_frame_equal(frame, pd.DataFrame(batch))
+
+
+def test_get_klines_paginated_arrow_schema_and_values():
+    ts = 1_700_000_000_000
+    raw = [_make_raw_kline(ts + i * 60_000) for i in range(3)]
+    client = BinanceClient()
+
+    responses = [_mock_response(raw), _mock_response([])]
+    with patch.object(client._session, "get", side_effect=responses):
+        batches = list(client.get_klines_paginated_arrow("BTCUSDT", "1m", ts, ts + 600_000))
+
+    assert len(batches) == 1
+    batch = batches[0]
+    ts_type = pa.timestamp("ms", tz="UTC")
+    assert batch.schema.field("open_time").type == ts_type
+    assert batch.schema.field("close_time").type == ts_type
+    assert batch.schema.field("trades").type == pa.int64()
+    assert batch.schema.field("open").type == pa.float64()
+
+    expected = pd.DataFrame([_parse_kline(k) for k in raw])
+    for col in ("open_time", "close_time"):
+        expected[col] = pd.to_datetime(expected[col], unit="ms", utc=True)
+    # schema asserted above; check_dtype=False only waives ms vs ns resolution
+    pd.testing.assert_frame_equal(batch.to_pandas(), expected, check_dtype=False)
+
+
+# ── retry (session adapter) ───────────────────────────────────────────────────
+
+
+def _http_responses(*specs: tuple[int, dict, object]):
+    """Patch urllib3 under the session adapter to replay (status, headers, body) specs.
+
+    Retry handling (urllib3.Retry mounted by BinanceClient) runs for real; only
+    the wire is mocked. Returns the patcher and the list of requests made.
+    """
+    calls: list[str] = []
+    queue = list(specs)
+
+    def fake_make_request(self, conn, method, url, **kwargs):
+        calls.append(url)
+        status, headers, body = queue.pop(0)
+        return HTTPResponse(
+            body=io.BytesIO(json.dumps(body).encode()),
+            headers=headers,
+            status=status,
+            preload_content=False,
+            request_method=method,
+        )
+
+    return patch.object(HTTPConnectionPool, "_make_request", fake_make_request), calls
+
+
+def test_retries_429_and_5xx_then_succeeds():
+    raw = [_make_raw_kline()]
+    patcher, calls = _http_responses(
+        (503, {}, {}),
+        (429, {"Retry-After": "7"}, {}),
+        (200, {"Content-Type": "application/json"}, raw),
+    )
+    client = BinanceClient()
+    with patcher, patch("time.sleep") as sleep:
+        result = client.get_klines("BTCUSDT", "1m", 1_700_000_000_000)
+
+    assert len(calls) == 3
+    assert result == [_parse_kline(raw[0])]
+    # first retry has zero backoff; the 429 waits for its Retry-After header
+    assert [c.args[0] for c in sleep.call_args_list] == [7]
+
+
+def test_retries_exhausted_raises_runtime_error():
+    patcher, calls = _http_responses(*[(500, {}, {})] * 4)
+    client = BinanceClient()
+    with patcher, patch("time.sleep") as sleep, pytest.raises(RuntimeError, match="BTCUSDT 1m"):
+        client.get_klines("BTCUSDT", "1m", 1_700_000_000_000)
+
+    assert len(calls) == 4  # first attempt + _MAX_RETRIES
+    assert [c.args[0] for c in sleep.call_args_list] == [2, 4]
+
+
+# ── concurrent range fetch ────────────────────────────────────────────────────
+
+
+def test_interval_ms_parses_binance_intervals():
+    assert _interval_ms("1m") == 60_000
+    assert _interval_ms("30m") == 30 * 60_000
+    assert _interval_ms("2h") == 2 * 3_600_000
+    assert _interval_ms("1w") == 7 * 86_400_000
+    for bad in ("", "m", "0h", "1x", "h1"):
+        with pytest.raises(ValueError, match="Unsupported kline interval"):
+            _interval_ms(bad)
+
+
+def test_range_windows_are_disjoint_and_cover_range():
+    assert _range_windows(0, 2_999, 1_000) == [(0, 999), (1_000, 1_999), (2_000, 2_999)]
+    assert _range_windows(0, 2_500, 1_000) == [(0, 999), (1_000, 1_999), (2_000, 2_500)]
+    assert _range_windows(5, 5, 1_000) == [(5, 5)]
+
+
+def _fake_klines_server(all_raw: list[list]):
+    """session.get stand-in honouring startTime/endTime/limit.
+
+    Each page also repeats the kline just before startTime, so concurrent
+    windows overlap at their boundaries and the merge has to dedup.
+    """
+
+    def get(url, params, timeout):
+        start, end = params["startTime"], params.get("endTime", float("inf"))
+        page = [k for k in all_raw if start <= k[0] <= end][: params["limit"]]
+        before = [k for k in all_raw if k[0] < start][-1:]
+        return _mock_response(before + page if page else page)
+
+    return get
+
+
+def test_concurrent_range_matches_paginated():
+    ts = 1_700_000_000_000
+    all_raw = [_make_raw_kline(ts + i * 60_000) for i in range(2 * _MAX_LIMIT + 300)]
+    end = ts + (len(all_raw) - 1) * 60_000
+    client = BinanceClient()
+
+    with patch.object(client._session, "get", side_effect=_fake_klines_server(all_raw)):
+        pages = client.get_klines_paginated("BTCUSDT", "1m", ts, end)
+        paginated = [k for page in pages for k in page]
+        concurrent = client.get_klines_range_concurrent(
+            "BTCUSDT", "1m", ts, end, max_workers=3, max_requests_per_s=1_000
+        )
+
+    expected = [_parse_kline(k) for k in all_raw]
+    assert concurrent == expected
+    # the sequential pull also sees the repeated boundary klines; dedup it to compare
+    assert concurrent == list({k["open_time"]: k for k in paginated}.values())
+
+
+def test_concurrent_range_rejects_unknown_interval():
+    with pytest.raises(ValueError, match="Unsupported kline interval"):
+        BinanceClient().get_klines_range_concurrent("BTCUSDT", "7x", 0, 1)
+
+
+def test_rate_limiter_paces_after_burst():
+    clock = {"now": 0.0, "slept": []}
+
+    def sleep(seconds: float) -> None:
+        clock["slept"].append(round(seconds, 9))
+        clock["now"] += seconds
+
+    with (
+        patch("trade_agent.data.binance_client.time.monotonic", side_effect=lambda: clock["now"]),
+        patch("trade_agent.data.binance_client.time.sleep", side_effect=sleep),
+    ):
+        limiter = _RateLimiter(rate=10.0, burst=2)
+        for _ in range(5):
+            limiter.acquire()
+
+    # burst of 2 is free, then one token per 1/rate seconds
+    assert clock["slept"] == [0.1, 0.1, 0.1]
@@ -0,0 +1,59 @@
+"""Unit tests for BacktestEngine: per-bar generate() vs batch precompute()."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from trade_agent import BacktestEngine, BacktestResult, FixedFractionRisk, PaperBroker
+from trade_agent.types import BatchStrategyLike, Candle, Signal, StrategyLike
+
+
+def _make_candles(n: int = 120) -> list[Candle]:
+    t0 = datetime(2024, 1, 1, tzinfo=UTC)
+    out = []
+    for i in range(n):
+        close = 100.0 + (i * 7) % 13 - 6
+        out.append(Candle(t0 + timedelta(hours=i), close, close + 1, close - 1, close, 1.0))
+    return out
+
+
+def _signal_at(i: int) -> Signal:
+    return Signal.BUY if i % 20 == 0 else Signal.SELL if i % 20 == 10 else Signal.HOLD
+
+
+class _PerBar:
+    """Strategy that only implements generate(history)."""
+
+    def generate(self, history: Sequence[Candle]) -> Signal:
+        return _signal_at(len(history) - 1)
+
+
+class _Batch(_PerBar):
+    """Same signals, produced in one precompute() pass."""
+
+    def precompute(self, candles: Sequence[Candle]) -> list[Signal]:
+        return [_signal_at(i) for i in range(len(candles))]
+
+
+class _ShortBatch(_PerBar):
+    def precompute(self, candles: Sequence[Candle]) -> list[Signal]:
+        return [Signal.HOLD] * (len(candles) - 1)
+
+
+def _run(strategy: StrategyLike | BatchStrategyLike) -> BacktestResult:
+    engine = BacktestEngine(_make_candles(), strategy, PaperBroker(10_000.0), FixedFractionRisk())
+    return engine.run()
+
+
+def test_precompute_matches_generate():
+    per_bar = _run(_PerBar())
+    assert per_bar.num_trades > 0
+    assert _run(_Batch()) == per_bar
+
+
+def test_precompute_length_mismatch_raises():
+    with pytest.raises(ValueError, match="precompute"):
+        _run(_ShortBatch())
@@ -0,0 +1,64 @@
+"""Unit tests for engine metrics: round-trip classification and drawdown."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from trade_agent.engine.metrics import classify_trades, compute_max_drawdown
+from trade_agent.types import OrderSide, Trade
+
+_T0 = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _trades(*legs: tuple[OrderSide, float, float, float]) -> list[Trade]:
+    """Build trades from (side, qty, price, fee) legs, one hour apart."""
+    return [
+        Trade(ts=_T0 + timedelta(hours=i), side=side, qty=qty, price=price, fee=fee)
+        for i, (side, qty, price, fee) in enumerate(legs)
+    ]
+
+
+# ── classify_trades ───────────────────────────────────────────────────────────
+
+
+def test_classify_trades_empty():
+    assert classify_trades([]) == (0, 0)
+
+
+def test_classify_trades_multi_buy_round_trip():
+    """Several BUYs before a SELL are one round-trip at their average cost."""
+    trades = _trades(
+        (OrderSide.BUY, 1.0, 100.0, 0.0),
+        (OrderSide.BUY, 1.0, 110.0, 0.0),
+        (OrderSide.SELL, 2.0, 106.0, 0.0),  # avg entry 105 → win
+        (OrderSide.BUY, 1.0, 100.0, 0.0),
+        (OrderSide.SELL, 1.0, 99.0, 0.0),  # loss
+    )
+    assert classify_trades(trades) == (1, 1)
+
+
+def test_classify_trades_skips_orphan_sell():
+    """A SELL with no accumulated BUYs is not a round-trip."""
+    trades = _trades(
+        (OrderSide.SELL, 1.0, 100.0, 0.0),
+        (OrderSide.BUY, 1.0, 100.0, 0.0),
+        (OrderSide.SELL, 1.0, 101.0, 0.0),
+        (OrderSide.SELL, 1.0, 90.0, 0.0),  # position already closed → orphan
+    )
+    assert classify_trades(trades) == (1, 0)
+
+
+def test_classify_trades_fee_turns_win_into_loss():
+    gross_win = _trades((OrderSide.BUY, 2.0, 100.0, 0.0), (OrderSide.SELL, 2.0, 100.5, 0.0))
+    assert classify_trades(gross_win) == (1, 0)
+    # sell fee of 2.0 on qty 2 → net 99.5 per unit, below the 100 entry
+    net_loss = _trades((OrderSide.BUY, 2.0, 100.0, 0.0), (OrderSide.SELL, 2.0, 100.5, 2.0))
+    assert classify_trades(net_loss) == (0, 1)
+
+
+# ── compute_max_drawdown ──────────────────────────────────────────────────────
+
+
+def test_max_drawdown_peak_to_trough():
+    assert compute_max_drawdown([100.0, 120.0, 90.0, 130.0]) == 25.0
+    assert compute_max_drawdown([]) == 0.0
@@ -4,13 +4,38 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from trade_agent.backtest import facts_strategy
+from trade_agent.backtest.facts_strategy import (
+    DEFAULT_PARAMS,
+    _calc_rsi,
+    _rsi_inputs,
+    generate_signals,
+    generate_signals_grid,
+    run_batch,
+    run_vectorized_backtest,
+)
 from trade_agent.db import connect, init_db, read_candles, upsert_candles
-from trade_agent.analysis.indicators import ema, atr, true_range
-from trade_agent.analysis.trend import compute_trend
-from trade_agent.analysis.sr import compute_sr
+from trade_agent.analysis.indicators import (
+    _ewm_nb,
+    atr,
+    cached_atr,
+    ema,
+    rsi,
+    sma,
+    sma_update,
+    true_range,
+)
+from trade_agent.analysis.explainer import explain_plan
+from trade_agent.analysis.payload import build_payload
+from trade_agent.analysis.pipeline import build_full
+from trade_agent.analysis.plan_builder import build_plan
+from trade_agent.analysis.trend import TrendState, compute_trend, trend_state, update_trend
+from trade_agent.analysis.sr import _pivot_highs, _pivot_lows, compute_sr
+from trade_agent.scripts.walk_forward import _analyze_window, _tf_facts
 
 
 # ── Fixtures ──────────────────────────────────────────────────────────────────
@@ -149,6 +174,98 @@ def test_trend_strength_bounded():
     assert 0.0 <= result["trend_strength"] <= 1.0
 
 
+def test_update_trend_matches_batch():
+    for trend in ("up", "down", "sideway"):
+        df = _make_candle_df(n=120, trend=trend)
+        state = trend_state()
+        for bar in df.itertuples():
+            facts = update_trend(state, bar.high, bar.low, bar.close)
+        assert facts == compute_trend(df)
+
+
+def test_trend_state_direct_construction_is_bounded():
+    """A TrendState built without trend_state() still tracks the slope window."""
+    df = _make_candle_df(n=120, trend="up")
+    state = TrendState(params={"slope_bars": 3})
+    assert state.slow_hist.maxlen == 4
+    for bar in df.itertuples():
+        facts = update_trend(state, bar.high, bar.low, bar.close)
+    assert facts == compute_trend(df, {"slope_bars": 3})
+    assert facts["ema_slow_slope"] != 0
+
+
+# ── Indicator Tests ───────────────────────────────────────────────────────────
+
+
+def test_true_range_matches_definition():
+    """TR = max(H-L, |H-prev_C|, |L-prev_C|); first bar falls back to H-L."""
+    df = _make_candle_df(n=50, trend="sideway")
+    prev_close = df["close"].shift(1)
+    expected = pd.concat(
+        [df["high"] - df["low"], (df["high"] - prev_close).abs(), (df["low"] - prev_close).abs()],
+        axis=1,
+    ).max(axis=1)
+    result = true_range(df)
+    assert result.index.equals(df.index)
+    assert result.iloc[0] == pytest.approx(df["high"].iloc[0] - df["low"].iloc[0])
+    pd.testing.assert_series_equal(result, expected, check_names=False)
+
+
+def test_sma_matches_rolling_mean():
+    df = _make_candle_df(n=120, trend="up")
+    close = df["close"].copy()
+    close.iloc[40] = float("nan")  # windows touching a NaN stay NaN
+    for period in (1, 5, 20):
+        expected = close.rolling(window=period, min_periods=period).mean()
+        pd.testing.assert_series_equal(sma(close, period), expected, check_names=False)
+
+
+def test_sma_update_slides_window():
+    close = _make_candle_df(n=30, trend="up")["close"]
+    full = sma(close, 10)
+    stepped = sma_update(full.iloc[20], close.iloc[21], close.iloc[11], 10)
+    assert stepped == pytest.approx(full.iloc[21])
+
+
+def test_ewm_kernel_matches_pandas():
+    """The Numba EWM recurrence reproduces pandas ewm(adjust=False), NaNs included."""
+    close = _make_candle_df(n=100, trend="sideway")["close"].copy()
+    close.iloc[:3] = float("nan")
+    close.iloc[50] = float("nan")
+    expected = close.ewm(alpha=0.1, adjust=False, min_periods=5).mean().to_numpy()
+    result = _ewm_nb(close.to_numpy(), 0.1, 5)
+    assert np.allclose(result, expected, equal_nan=True)
+
+
+def test_indicators_match_pandas_reference():
+    df = _make_candle_df(n=200, trend="up")
+    close = df["close"]
+    assert np.allclose(ema(close, 20), close.ewm(span=20, adjust=False).mean())
+    assert np.allclose(atr(df, 14), true_range(df).ewm(alpha=1 / 14, adjust=False).mean())
+    chop = _make_candle_df(n=200, trend="sideway")["close"]
+    assert 0.0 <= rsi(chop, 14).iloc[-1] <= 100.0
+
+
+def test_cached_atr_reuses_and_invalidates():
+    df = _make_candle_df(n=100)
+    first = cached_atr(df, 14)
+    assert cached_atr(df, 14) is first
+    df.loc[df.index[-1], "high"] *= 1.05  # edited last bar → recompute
+    again = cached_atr(df, 14)
+    assert again is not first
+    assert np.allclose(again, atr(df, 14))
+    assert cached_atr(df.copy(), 14) is again  # keyed on content, not identity
+    df.loc[df.index[:50], "close"] *= 1.02  # in-place edit of early bars → recompute
+    edited = cached_atr(df, 14)
+    assert edited is not again
+    assert np.array_equal(edited, atr(df, 14))
+
+
+def test_rsi_edge_cases():
+    assert rsi(_make_candle_df(n=50, trend="up")["close"], 14).iloc[-1] == 100.0
+    assert np.isnan(rsi(pd.Series([100.0] * 20), 14).iloc[-1])
+
+
 # ── S/R Tests ─────────────────────────────────────────────────────────────────
 
 
@@ -172,8 +289,157 @@ def test_sr_returns_expected_structure():
         assert lv["score"] >= 0
 
 
+def test_pivots_are_strict_extrema():
+    highs = [1.0, 2.0, 5.0, 2.0, 1.0, 5.0, 5.0, 1.0, 0.0]
+    df = pd.DataFrame({"high": highs, "low": [-h for h in highs]})
+    # bar 2 is a strict 2-bar fractal high; the tied 5.0s at bars 5/6 are not
+    assert _pivot_highs(df, 2) == [(2, 5.0)]
+    assert _pivot_lows(df, 2) == [(2, -5.0)]
+
+
+def _sr_walk_df() -> pd.DataFrame:
+    """Seeded random walk with enough swings to fill compute_sr's level cap."""
+    df = _make_candle_df(n=300, trend="sideway")
+    walk = np.exp(np.random.default_rng(2).normal(0, 0.01, len(df)).cumsum())
+    ohlc = ["open", "high", "low", "close"]
+    df[ohlc] = df[ohlc].mul(walk, axis=0)
+    return df
+
+
+def test_sr_levels_regression():
+    """Pinned top levels: pivot scoring and clustering must not drift."""
+    levels = compute_sr(_sr_walk_df())["levels"]
+    assert len(levels) == 20
+    keys = ("price", "kind", "score", "touches", "structural")
+    top = [tuple(lv[k] for k in keys) for lv in levels[:5]]
+    assert top == [
+        (30141.11, "resistance", 4.7458, 9, True),
+        (30653.91, "resistance", 4.4321, 10, True),
+        (29448.8, "resistance", 4.3877, 6, True),
+        (29828.34, "resistance", 3.1598, 8, True),
+        (29071.79, "resistance", 3.1067, 6, True),
+    ]
+
+
+def test_sr_cluster_aggregates_regression():
+    """Pinned per-cluster aggregates: last touch and zone bounds of the top clusters."""
+    result = compute_sr(_sr_walk_df())
+    assert [lv["last_touched"] for lv in result["levels"][:3]] == [
+        "2024-01-11 04:00:00+00:00",
+        "2024-01-10 05:00:00+00:00",
+        "2024-01-10 14:00:00+00:00",
+    ]
+    zones = [(z["kind"], z["low"], z["high"], z["score"]) for z in result["zones"][:3]]
+    assert zones == [
+        ("resistance", 30101.23, 30180.99, 4.7458),
+        ("resistance", 30614.03, 30693.8, 4.4321),
+        ("resistance", 29408.92, 29488.69, 4.3877),
+    ]
+
+
 def test_sr_empty_on_too_few_bars():
     df = _make_candle_df(n=5)  # not enough bars for fractals
     result = compute_sr(df)
     assert result["levels"] == []
     assert result["zones"] == []
+
+
+# ── Strategy Tests ────────────────────────────────────────────────────────────
+
+
+def test_rsi_inputs_reused_across_threshold_sweeps():
+    df = _make_candle_df(n=200, trend="sideway")
+    first = _rsi_inputs(df, DEFAULT_PARAMS)
+    assert _rsi_inputs(df, {**DEFAULT_PARAMS, "rsi_momentum_long": 70}) is first
+    assert _rsi_inputs(df, {**DEFAULT_PARAMS, "wma_period": 20}) is not first
+    df.loc[df.index[-1], "close"] *= 1.01  # edited last bar → recompute
+    edited = _rsi_inputs(df, DEFAULT_PARAMS)
+    assert edited is not first
+    assert _rsi_inputs(df.copy(), DEFAULT_PARAMS) is edited  # keyed on content, not identity
+    df.loc[df.index[:100], "close"] *= 0.98  # in-place edit of early bars → recompute
+    rsi_now = _rsi_inputs(df, DEFAULT_PARAMS)[0]
+    assert not rsi_now.equals(edited[0])
+    assert rsi_now.equals(_calc_rsi(df["close"], DEFAULT_PARAMS["rsi_period"]))
+
+
+def test_signal_grid_matches_single_runs():
+    df = _make_candle_df(n=300, trend="sideway")
+    grid = [{"rsi_momentum_long": m, "wma_period": w} for m in (60, 80) for w in (20, 45)]
+    out = generate_signals_grid(df, grid)
+    assert out.columns.names == ["rsi_momentum_long", "wma_period"]
+    for k, params in enumerate(grid):
+        pd.testing.assert_series_equal(
+            out.iloc[:, k], generate_signals(df, params=params), check_names=False
+        )
+
+
+def test_run_batch_matches_sequential_backtests():
+    df = _make_candle_df(n=400, trend="sideway")
+    df.index.name = "open_time"  # trade_log stamps come from the open_time index
+    walk = np.exp(np.random.default_rng(0).normal(0, 0.01, len(df)).cumsum())
+    df[["open", "high", "low", "close"]] = df[["open", "high", "low", "close"]].mul(walk, axis=0)
+    grid = [
+        {"rsi_momentum_long": 60},
+        {"rsi_momentum_long": 60, "fee_bps": 10.0},
+        {"wma_period": 20, "fee_bps": 0.0},
+    ]
+    expected = []
+    for combo in grid:
+        params = dict(combo)
+        fee_bps = params.pop("fee_bps", 2.0)
+        signals = generate_signals(df, params=params)
+        expected.append(run_vectorized_backtest(df, signals, fee_bps=fee_bps))
+    assert expected[0]["metrics"]["trades"] > 0
+    assert expected[0] != expected[1]  # fee_bps reaches the backtest, not the signals
+    assert run_batch(df, None, grid) == expected  # in-process default
+    assert facts_strategy._BATCH_INPUTS is None  # inline path pins nothing globally
+    assert run_batch(df, None, grid, max_workers=2) == expected
+    assert grid[1] == {"rsi_momentum_long": 60, "fee_bps": 10.0}  # combos not mutated
+
+
+# ── Pipeline Tests ────────────────────────────────────────────────────────────
+
+
+def test_build_full_matches_separate_stages():
+    df = _make_candle_df(n=300, trend="up")
+    per_tf_facts = {
+        tf: {"trend": compute_trend(df), "sr": compute_sr(df)} for tf in ("1h", "4h", "1d")
+    }
+    as_of = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+    payload, plan, evidence = build_full("BTCUSDT", as_of, per_tf_facts)
+
+    expected_payload = build_payload("BTCUSDT", as_of, per_tf_facts)
+    expected_plan = build_plan(expected_payload)
+    assert payload == expected_payload
+    assert plan == expected_plan
+    assert evidence == explain_plan(expected_payload, expected_plan)
+
+
+def test_walk_forward_memoized_facts_match_uncached():
+    daily = _make_candle_df(n=60, interval_h=24, trend="sideway")
+    walk = np.exp(np.random.default_rng(1).normal(0, 0.02, len(daily)).cumsum())
+    ohlc = ["open", "high", "low", "close"]
+    daily[ohlc] = daily[ohlc].mul(walk, axis=0)
+    history = {"1h": _make_candle_df(n=600, interval_h=1, trend="sideway"), "1d": daily}
+    memo: dict = {}
+    start = datetime(2024, 1, 20, tzinfo=timezone.utc)
+    ends = [start + timedelta(hours=6 * k) for k in range(8)]
+    for train_end in ends:
+        cached = _analyze_window(history, "BTCUSDT", train_end, 500, memo)
+        assert cached == _analyze_window(history, "BTCUSDT", train_end, 500)
+    # the 1d slice only moves once per day, so 8 six-hour steps reuse it
+    assert len(memo) < 2 * len(ends)
+
+    df = history["1d"]
+    first = _tf_facts("BTCUSDT", "1d", df, memo)
+    again = _tf_facts("BTCUSDT", "1d", df, memo)
+    assert again == first and again is not first
+    assert again["sr"]["levels"]
+    again["sr"]["levels"].clear()  # a hit is a deep copy: the memo is untouched
+    assert _tf_facts("BTCUSDT", "1d", df, memo) == first
+
+    fresh: dict = {}
+    missed = _tf_facts("BTCUSDT", "1d", df, fresh)
+    missed["sr"]["levels"].clear()  # so is the result of a miss
+    assert _tf_facts("BTCUSDT", "1d", df, fresh) == first